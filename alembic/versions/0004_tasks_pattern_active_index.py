@@ -0,0 +1,45 @@
+"""add partial index for open recurring task instances
+
+Revision ID: 0004_tasks_pattern_active_index
+Revises: 0003_telegram_chat_member_id
+Create Date: 2026-10-15 09:00:00.000000
+
+Backs stream_tasks_for_pattern(include_completed=False). ix_tasks_recurring_pattern
+covers every instance a pattern ever generated, so long-running patterns
+drag their whole history of done tasks through the scan. This index only
+holds the open ones (same `status <> 'done'` predicate as the query), so
+the lookup stays proportional to what's still on the list. Built
+concurrently so tasks stays writable while it's created.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0004_tasks_pattern_active_index"
+down_revision: Union[str, Sequence[str], None] = "0003_telegram_chat_member_id"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_pattern_active",
+            "tasks",
+            ["recurring_pattern_id", "occurrence_date"],
+            postgresql_where=sa.text("status <> 'done'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_pattern_active",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
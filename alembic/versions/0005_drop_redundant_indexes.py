@@ -0,0 +1,49 @@
+"""drop single-column indexes covered by composite indexes
+
+Revision ID: 0005_drop_redundant_indexes
+Revises: 0004_tasks_pattern_active_index
+Create Date: 2026-10-15 10:00:00.000000
+
+Each of these indexes is the leading column of a composite index on the
+same table, which Postgres can use for the same lookups. Keeping both
+only costs an extra btree update on every write (tasks had two of them
+on the generate_task_instances path) and shared_buffers space.
+
+The initial migration no longer creates them, so this only does work on
+databases built before that change; IF EXISTS makes it a no-op otherwise.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0005_drop_redundant_indexes"
+down_revision: Union[str, Sequence[str], None] = "0004_tasks_pattern_active_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns) -> covered by
+_REDUNDANT_INDEXES = [
+    ("ix_family_members_family_id", "family_members", ["family_id"]),  # ix_family_members_family_role
+    ("ix_recurring_patterns_family_id", "recurring_patterns", ["family_id"]),  # ix_recurring_patterns_family_active
+    ("ix_tasks_family_id", "tasks", ["family_id"]),  # ix_tasks_family_status_due
+    ("ix_tasks_recurring_pattern_id", "tasks", ["recurring_pattern_id"]),  # ix_tasks_recurring_pattern
+    ("ix_reminders_due_at", "reminders", ["due_at"]),  # ix_reminders_due_unsent
+    ("ix_reminders_task_id", "reminders", ["task_id"]),  # ix_reminders_task_user
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in _REDUNDANT_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _REDUNDANT_INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True, if_not_exists=True
+            )
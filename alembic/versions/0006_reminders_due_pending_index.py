@@ -0,0 +1,58 @@
+"""replace ix_reminders_due_unsent with a partial index on unsent reminders
+
+Revision ID: 0006_reminders_due_pending_index
+Revises: 0005_drop_redundant_indexes
+Create Date: 2026-10-15 12:00:00.000000
+
+Backs get_due_reminders(), which the scheduler polls. ix_reminders_due_unsent
+(due_at, sent_at) holds every reminder ever sent, so the due_at <= now()
+range scan walks the whole sent history and filters it out row by row.
+The partial index only holds unsent reminders (same `sent_at IS NULL`
+predicate as the query) in due_at order, so ORDER BY due_at LIMIT n stops
+after n entries. Built and dropped concurrently so reminders stays writable.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0006_reminders_due_pending_index"
+down_revision: Union[str, Sequence[str], None] = "0005_drop_redundant_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_reminders_due_pending",
+            "reminders",
+            ["due_at"],
+            postgresql_where=sa.text("sent_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_reminders_due_unsent",
+            table_name="reminders",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_reminders_due_unsent",
+            "reminders",
+            ["due_at", "sent_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_reminders_due_pending",
+            table_name="reminders",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
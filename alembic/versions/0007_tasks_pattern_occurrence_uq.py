@@ -0,0 +1,114 @@
+"""make (recurring_pattern_id, occurrence_date) unique on tasks
+
+Revision ID: 0007_tasks_pattern_occurrence_uq
+Revises: 0006_reminders_due_pending_index
+Create Date: 2026-10-15 13:00:00.000000
+
+generate_task_instances reads the dates a pattern already has, then
+bulk-inserts the missing ones. Two runs for the same pattern (the
+background prefill after create/activate and a manual /generate) can
+interleave and both insert the same date. The unique index lets the
+insert use ON CONFLICT DO NOTHING instead.
+
+It has the same columns as ix_tasks_recurring_pattern, so it replaces it
+for the pattern/date lookups. Ad-hoc tasks have a NULL pattern id, and
+NULLs never conflict.
+
+Duplicates left behind by the race are removed first. Per
+(pattern, date) the instance that was acted on (any status but todo)
+is kept, otherwise the oldest one.
+
+During a rolling deploy, old instances still insert without ON CONFLICT
+and can add a duplicate between the cleanup and the concurrent build.
+The build then fails and leaves an INVALID index behind. Postgres
+ignores invalid indexes for ON CONFLICT inference, so a re-run drops
+such a leftover before cleaning up and building again. The old index is
+only dropped once the new one is valid.
+"""
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0007_tasks_pattern_occurrence_uq"
+down_revision: Union[str, Sequence[str], None] = "0006_reminders_due_pending_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _index_is_valid(name: str) -> Optional[bool]:
+    """indisvalid for the named index, or None if it doesn't exist"""
+    return op.get_bind().execute(
+        sa.text(
+            """
+            SELECT i.indisvalid
+            FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = :name
+            """
+        ),
+        {"name": name},
+    ).scalar()
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Leftover from a failed concurrent build; if_not_exists would skip it
+        if _index_is_valid("uq_tasks_pattern_occurrence") is False:
+            op.drop_index(
+                "uq_tasks_pattern_occurrence",
+                table_name="tasks",
+                postgresql_concurrently=True,
+            )
+
+        op.execute(
+            """
+            DELETE FROM tasks
+            USING (
+                SELECT id, row_number() OVER (
+                    PARTITION BY recurring_pattern_id, occurrence_date
+                    ORDER BY status = 'todo', id
+                ) AS rn
+                FROM tasks
+                WHERE recurring_pattern_id IS NOT NULL
+            ) ranked
+            WHERE tasks.id = ranked.id AND ranked.rn > 1
+            """
+        )
+        op.create_index(
+            "uq_tasks_pattern_occurrence",
+            "tasks",
+            ["recurring_pattern_id", "occurrence_date"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        if not _index_is_valid("uq_tasks_pattern_occurrence"):
+            raise RuntimeError(
+                "uq_tasks_pattern_occurrence is not valid; "
+                "keeping ix_tasks_recurring_pattern, re-run the migration"
+            )
+        op.drop_index(
+            "ix_tasks_recurring_pattern",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_recurring_pattern",
+            "tasks",
+            ["recurring_pattern_id", "occurrence_date"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "uq_tasks_pattern_occurrence",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
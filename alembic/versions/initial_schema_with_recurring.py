@@ -18,6 +18,52 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# (name, table, columns) for every index, created by _create_indexes() after the tables
+_INDEXES = [
+    ('ix_families_created_at', 'families', ['created_at']),
+    ('ix_users_created_at', 'users', ['created_at']),
+    ('ix_users_phone_e164', 'users', ['phone_e164']),
+    ('ix_family_members_created_at', 'family_members', ['created_at']),
+    ('ix_family_members_family_role', 'family_members', ['family_id', 'role']),
+    ('ix_family_members_user_id', 'family_members', ['user_id']),
+    ('ix_recurring_patterns_created_at', 'recurring_patterns', ['created_at']),
+    ('ix_recurring_patterns_family_active', 'recurring_patterns', ['family_id', 'is_active']),
+    ('ix_recurring_patterns_is_active', 'recurring_patterns', ['is_active']),
+    ('ix_tasks_assignee_user_id', 'tasks', ['assignee_user_id']),
+    ('ix_tasks_created_at', 'tasks', ['created_at']),
+    ('ix_tasks_due_at', 'tasks', ['due_at']),
+    ('ix_tasks_family_status_due', 'tasks', ['family_id', 'status', 'due_at']),
+    ('ix_tasks_recurring_pattern', 'tasks', ['recurring_pattern_id', 'occurrence_date']),
+    ('ix_tasks_status', 'tasks', ['status']),
+    ('ix_reminders_created_at', 'reminders', ['created_at']),
+    ('ix_reminders_due_unsent', 'reminders', ['due_at', 'sent_at']),
+    ('ix_reminders_task_user', 'reminders', ['task_id', 'user_id']),
+    ('ix_reminders_user_id', 'reminders', ['user_id']),
+]
+
+
+def _create_indexes() -> None:
+    """
+    Create all indexes once every table exists.
+    
+    On PostgreSQL each index is built with CREATE INDEX CONCURRENTLY in its
+    own autocommit transaction, so re-applying this migration over populated
+    tables doesn't hold a write lock for the whole build, and IF NOT EXISTS
+    lets a partially applied run resume.
+    """
+    if op.get_context().dialect.name != 'postgresql':
+        for name, table, columns in _INDEXES:
+            op.create_index(op.f(name), table, columns, unique=False)
+        return
+    
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.create_index(
+                op.f(name), table, columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True
+            )
+
+
 def upgrade() -> None:
     """Upgrade schema - Create all tables including recurring patterns."""
     
@@ -35,7 +81,6 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(), nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_families_created_at'), 'families', ['created_at'], unique=False)
     
     # Create users table
     op.create_table('users',
@@ -50,8 +95,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('phone_e164', name='uq_users_phone')
     )
-    op.create_index(op.f('ix_users_created_at'), 'users', ['created_at'], unique=False)
-    op.create_index(op.f('ix_users_phone_e164'), 'users', ['phone_e164'], unique=False)
     
     # Create family_members table
     op.create_table('family_members',
@@ -66,10 +109,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('family_id', 'user_id', name='uq_family_user')
     )
-    op.create_index(op.f('ix_family_members_created_at'), 'family_members', ['created_at'], unique=False)
-    op.create_index(op.f('ix_family_members_family_id'), 'family_members', ['family_id'], unique=False)
-    op.create_index('ix_family_members_family_role', 'family_members', ['family_id', 'role'], unique=False)
-    op.create_index(op.f('ix_family_members_user_id'), 'family_members', ['user_id'], unique=False)
     
     # Create recurring_patterns table
     op.create_table('recurring_patterns',
@@ -97,10 +136,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['family_id'], ['families.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_recurring_patterns_created_at'), 'recurring_patterns', ['created_at'], unique=False)
-    op.create_index(op.f('ix_recurring_patterns_family_id'), 'recurring_patterns', ['family_id'], unique=False)
-    op.create_index('ix_recurring_patterns_family_active', 'recurring_patterns', ['family_id', 'is_active'], unique=False)
-    op.create_index(op.f('ix_recurring_patterns_is_active'), 'recurring_patterns', ['is_active'], unique=False)
     
     # Create tasks table (with recurring pattern support)
     op.create_table('tasks',
@@ -124,14 +159,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['recurring_pattern_id'], ['recurring_patterns.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_tasks_assignee_user_id'), 'tasks', ['assignee_user_id'], unique=False)
-    op.create_index(op.f('ix_tasks_created_at'), 'tasks', ['created_at'], unique=False)
-    op.create_index(op.f('ix_tasks_due_at'), 'tasks', ['due_at'], unique=False)
-    op.create_index(op.f('ix_tasks_family_id'), 'tasks', ['family_id'], unique=False)
-    op.create_index('ix_tasks_family_status_due', 'tasks', ['family_id', 'status', 'due_at'], unique=False)
-    op.create_index('ix_tasks_recurring_pattern', 'tasks', ['recurring_pattern_id', 'occurrence_date'], unique=False)
-    op.create_index(op.f('ix_tasks_recurring_pattern_id'), 'tasks', ['recurring_pattern_id'], unique=False)
-    op.create_index(op.f('ix_tasks_status'), 'tasks', ['status'], unique=False)
     
     # Create reminders table
     op.create_table('reminders',
@@ -147,12 +174,9 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_reminders_created_at'), 'reminders', ['created_at'], unique=False)
-    op.create_index(op.f('ix_reminders_due_at'), 'reminders', ['due_at'], unique=False)
-    op.create_index('ix_reminders_due_unsent', 'reminders', ['due_at', 'sent_at'], unique=False)
-    op.create_index(op.f('ix_reminders_task_id'), 'reminders', ['task_id'], unique=False)
-    op.create_index('ix_reminders_task_user', 'reminders', ['task_id', 'user_id'], unique=False)
-    op.create_index(op.f('ix_reminders_user_id'), 'reminders', ['user_id'], unique=False)
+    
+    # Indexes go in last, once every table exists
+    _create_indexes()
 
 
 def downgrade() -> None:
@@ -161,17 +185,13 @@ def downgrade() -> None:
     # Drop tables in reverse order (respecting foreign keys)
     op.drop_index(op.f('ix_reminders_user_id'), table_name='reminders')
     op.drop_index('ix_reminders_task_user', table_name='reminders')
-    op.drop_index(op.f('ix_reminders_task_id'), table_name='reminders')
     op.drop_index('ix_reminders_due_unsent', table_name='reminders')
-    op.drop_index(op.f('ix_reminders_due_at'), table_name='reminders')
     op.drop_index(op.f('ix_reminders_created_at'), table_name='reminders')
     op.drop_table('reminders')
     
     op.drop_index(op.f('ix_tasks_status'), table_name='tasks')
-    op.drop_index(op.f('ix_tasks_recurring_pattern_id'), table_name='tasks')
     op.drop_index('ix_tasks_recurring_pattern', table_name='tasks')
     op.drop_index('ix_tasks_family_status_due', table_name='tasks')
-    op.drop_index(op.f('ix_tasks_family_id'), table_name='tasks')
     op.drop_index(op.f('ix_tasks_due_at'), table_name='tasks')
     op.drop_index(op.f('ix_tasks_created_at'), table_name='tasks')
     op.drop_index(op.f('ix_tasks_assignee_user_id'), table_name='tasks')
@@ -179,13 +199,11 @@ def downgrade() -> None:
     
     op.drop_index(op.f('ix_recurring_patterns_is_active'), table_name='recurring_patterns')
     op.drop_index('ix_recurring_patterns_family_active', table_name='recurring_patterns')
-    op.drop_index(op.f('ix_recurring_patterns_family_id'), table_name='recurring_patterns')
     op.drop_index(op.f('ix_recurring_patterns_created_at'), table_name='recurring_patterns')
     op.drop_table('recurring_patterns')
     
     op.drop_index(op.f('ix_family_members_user_id'), table_name='family_members')
     op.drop_index('ix_family_members_family_role', table_name='family_members')
-    op.drop_index(op.f('ix_family_members_family_id'), table_name='family_members')
     op.drop_index(op.f('ix_family_members_created_at'), table_name='family_members')
     op.drop_table('family_members')
     
@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Optional, Union
+
+from fastapi import Request, Response, status
+
+# Polling clients may reuse a response this long before revalidating
+CACHE_CONTROL = "private, max-age=5"
+
+
+def make_etag(*parts: Union[datetime, int, None]) -> str:
+    """Build a weak ETag from the updated_at stamps (and counts) that make up a response"""
+    encoded = [
+        part.strftime("%Y%m%d%H%M%S%f") if isinstance(part, datetime) else str(part or 0)
+        for part in parts
+    ]
+    return f'W/"{"-".join(encoded)}"'
+
+
+def wants_revalidation(request: Request) -> bool:
+    """True if the client sent If-None-Match (worth a cheap version lookup)"""
+    return "if-none-match" in request.headers
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Return a bodiless 304 if the client's If-None-Match matches the ETag.
+
+    Uses weak comparison (RFC 9110), so W/ prefixes are ignored on both sides.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if "*" in tags or etag.removeprefix("W/") in tags:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        )
+    return None
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach ETag and Cache-Control headers to a full response"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
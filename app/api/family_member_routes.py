@@ -1,28 +1,31 @@
 from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas import FamilyMember, FamilyMemberCreate, FamilyMemberUpdate, FamilyMemberWithUser
 from app.core.database import get_db
-from app.services import family_member_service, family_service, user_service
+from app.services import family_member_service, family_service, reference_service, user_service
 
 router = APIRouter(tags=["family-members"])
 
 @router.get("/families/{family_id}/members", response_model=List[FamilyMemberWithUser])
 async def get_family_members(
     family_id: int,
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of members to return"),
+    offset: int = Query(0, ge=0, description="Number of members to skip"),
     db: AsyncSession = Depends(get_db)
 ) -> List[FamilyMemberWithUser]:
-    """Get all members of a family"""
-    # Verify family exists
-    family = await family_service.get_family_by_id(db, family_id)
-    if not family:
+    """Get members of a family (paginated)"""
+    # Verify family exists. The check is cached per worker, so for a few
+    # seconds after a delete on another instance this can answer 200 []
+    # instead of 404 - accepted for a read that has nothing to return anyway
+    if not await family_service.family_exists(db, family_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Family with id {family_id} not found"
         )
     
-    members = await family_member_service.get_family_members(db, family_id)
+    members = await family_member_service.get_family_members(db, family_id, limit=limit, offset=offset)
     return members
 
 @router.get("/users/{user_id}/families", response_model=List[FamilyMember])
@@ -31,9 +34,8 @@ async def get_user_families(
     db: AsyncSession = Depends(get_db)
 ) -> List[FamilyMember]:
     """Get all families a user belongs to"""
-    # Verify user exists
-    user = await user_service.get_user_by_id(db, user_id)
-    if not user:
+    # Verify user exists (cached like the family check above, same staleness)
+    if not await user_service.user_exists(db, user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with id {user_id} not found"
@@ -63,34 +65,30 @@ async def add_family_member(
     db: AsyncSession = Depends(get_db)
 ) -> FamilyMemberWithUser:
     """Add a user to a family with a specific role"""
-    # Verify family exists
-    family = await family_service.get_family_by_id(db, family_id)
-    if not family:
+    member = await family_member_service.create_family_member(db, family_id, member_data)
+    if member:
+        return member
+    
+    # Nothing was inserted - find out which check failed
+    existing = await reference_service.validate_references(
+        db, family_id=family_id, user_ids=[member_data.user_id]
+    )
+    if ("family", family_id) not in existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Family with id {family_id} not found"
         )
     
-    # Verify user exists
-    user = await user_service.get_user_by_id(db, member_data.user_id)
-    if not user:
+    if ("user", member_data.user_id) not in existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with id {member_data.user_id} not found"
         )
     
-    # Check if user is already a member
-    existing_member = await family_member_service.get_family_member_by_user(
-        db, family_id, member_data.user_id
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"User {member_data.user_id} is already a member of family {family_id}"
     )
-    if existing_member:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"User {member_data.user_id} is already a member of family {family_id}"
-        )
-    
-    member = await family_member_service.create_family_member(db, family_id, member_data)
-    return member
 
 @router.put("/family-members/{member_id}", response_model=FamilyMemberWithUser)
 async def update_family_member(
@@ -1,28 +1,46 @@
 from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas import Family, FamilyCreate, FamilyUpdate, FamilyWithMembers
+from app.api.etag import make_etag, not_modified, set_etag, wants_revalidation
 from app.core.database import get_db
 from app.services import family_service
 
 router = APIRouter(prefix="/families", tags=["families"])
 
 @router.get("", response_model=List[Family])
-async def get_families(db: AsyncSession = Depends(get_db)) -> List[Family]:
-    """Get all families"""
-    families = await family_service.get_families(db)
+async def get_families(
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of families to return"),
+    offset: int = Query(0, ge=0, description="Number of families to skip"),
+    db: AsyncSession = Depends(get_db)
+) -> List[Family]:
+    """Get families (paginated)"""
+    families = await family_service.get_families(db, limit=limit, offset=offset)
     return families
 
 @router.get("/{family_id}", response_model=Family)
-async def get_family(family_id: int, db: AsyncSession = Depends(get_db)) -> Family:
-    """Get a specific family by ID"""
+async def get_family(
+    family_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+) -> Family:
+    """Get a specific family by ID (honors If-None-Match)"""
+    if wants_revalidation(request):
+        updated_at = await family_service.get_family_updated_at(db, family_id)
+        if updated_at is not None:
+            cached = not_modified(request, make_etag(updated_at))
+            if cached:
+                return cached
+    
     family = await family_service.get_family_by_id(db, family_id)
     if not family:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Family with id {family_id} not found"
         )
+    set_etag(response, make_etag(family.updated_at))
     return family
 
 @router.get("/{family_id}/with-members", response_model=FamilyWithMembers)
@@ -1,97 +1,218 @@
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends, Query, Request, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime, timedelta
 
 from app.api.schemas import (
     RecurringPattern, 
     RecurringPatternCreate, 
+    RecurringPatternBatchCreate,
     RecurringPatternUpdate, 
     RecurringPatternWithDetails,
     TaskWithDetails
 )
+from app.api.etag import make_etag, not_modified, set_etag, wants_revalidation
+from app.api.streaming import stream_json_array
 from app.core.database import get_db
-from app.services import recurring_pattern_service, family_service, user_service
+from app.services import recurring_pattern_service, reference_service
 
 router = APIRouter(prefix="/recurring-patterns", tags=["recurring-patterns"])
 
+# FKs a plain (unguarded) pattern INSERT can trip over
+_PATTERN_REFERENCE_FKEYS = {
+    "recurring_patterns_family_id_fkey",
+    "recurring_patterns_default_assignee_user_id_fkey",
+    "recurring_patterns_created_by_user_id_fkey",
+}
+
+# FKs an update can trip over when it changes the default assignee
+_ASSIGNEE_FKEYS = {
+    "recurring_patterns_default_assignee_user_id_fkey",
+    "tasks_assignee_user_id_fkey",
+}
+
+
+async def _missing_reference_error(
+    db: AsyncSession,
+    pattern_data: RecurringPatternCreate
+) -> Optional[HTTPException]:
+    """404 for the first family/user the pattern references that doesn't exist, if any"""
+    existing = await reference_service.validate_references(
+        db,
+        family_id=pattern_data.family_id,
+        user_ids=[pattern_data.default_assignee_user_id, pattern_data.created_by_user_id]
+    )
+    
+    if ("family", pattern_data.family_id) not in existing:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Family with id {pattern_data.family_id} not found"
+        )
+    
+    if pattern_data.default_assignee_user_id and ("user", pattern_data.default_assignee_user_id) not in existing:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with id {pattern_data.default_assignee_user_id} not found"
+        )
+    
+    if pattern_data.created_by_user_id and ("user", pattern_data.created_by_user_id) not in existing:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Creator user with id {pattern_data.created_by_user_id} not found"
+        )
+    
+    return None
+
+
+def _reference_race_error() -> HTTPException:
+    """409 for a write rejected over a reference that exists by the time we look"""
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="A referenced family or user changed while the pattern was being created; please retry"
+    )
+
 
 @router.get("", response_model=List[RecurringPatternWithDetails])
 async def get_recurring_patterns(
+    request: Request,
+    response: Response,
     family_id: Optional[int] = Query(None, description="Filter by family ID"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of patterns to return"),
+    offset: int = Query(0, ge=0, description="Number of patterns to skip"),
     db: AsyncSession = Depends(get_db)
 ) -> List[RecurringPatternWithDetails]:
-    """Get recurring patterns with optional filters"""
-    patterns = await recurring_pattern_service.get_recurring_patterns(
+    """Get recurring patterns with optional filters (paginated, honors If-None-Match)"""
+    # Versioned before the rows are read, like the task list
+    version = await recurring_pattern_service.get_recurring_patterns_list_version(
         db,
         family_id=family_id,
         is_active=is_active
     )
+    etag = make_etag(*version)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    
+    patterns = await recurring_pattern_service.get_recurring_patterns(
+        db,
+        family_id=family_id,
+        is_active=is_active,
+        limit=limit,
+        offset=offset
+    )
+    set_etag(response, etag)
     return patterns
 
 
 @router.get("/{pattern_id}", response_model=RecurringPatternWithDetails)
 async def get_recurring_pattern(
     pattern_id: int, 
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ) -> RecurringPatternWithDetails:
-    """Get a specific recurring pattern by ID"""
+    """Get a specific recurring pattern by ID (honors If-None-Match)"""
+    if wants_revalidation(request):
+        stamps = await recurring_pattern_service.get_recurring_pattern_updated_at(db, pattern_id)
+        if stamps is not None:
+            cached = not_modified(request, make_etag(*stamps))
+            if cached:
+                return cached
+    
     pattern = await recurring_pattern_service.get_recurring_pattern_by_id(db, pattern_id)
     if not pattern:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring pattern with id {pattern_id} not found"
         )
+    set_etag(response, make_etag(
+        pattern.updated_at,
+        pattern.default_assignee.updated_at if pattern.default_assignee else None,
+        pattern.created_by.updated_at if pattern.created_by else None
+    ))
     return pattern
 
 
 @router.post("", response_model=RecurringPatternWithDetails, status_code=status.HTTP_201_CREATED)
 async def create_recurring_pattern(
     pattern_data: RecurringPatternCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ) -> RecurringPatternWithDetails:
-    """Create a new recurring pattern"""
-    # Verify family exists
-    family = await family_service.get_family_by_id(db, pattern_data.family_id)
-    if not family:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Family with id {pattern_data.family_id} not found"
-        )
-    
-    # Verify default assignee exists if provided
-    if pattern_data.default_assignee_user_id:
-        assignee = await user_service.get_user_by_id(db, pattern_data.default_assignee_user_id)
-        if not assignee:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with id {pattern_data.default_assignee_user_id} not found"
-            )
-    
-    # Verify creator exists if provided
-    if pattern_data.created_by_user_id:
-        creator = await user_service.get_user_by_id(db, pattern_data.created_by_user_id)
-        if not creator:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Creator user with id {pattern_data.created_by_user_id} not found"
-            )
-    
+    """Create a new recurring pattern (its first tasks are generated in the background)"""
     pattern = await recurring_pattern_service.create_recurring_pattern(
         db, 
         pattern_data, 
         pattern_data.created_by_user_id
     )
+    if not pattern:
+        # Nothing was inserted - find out which reference is missing. If they
+        # all exist now, one was created or deleted in between; don't blame any
+        error = await _missing_reference_error(db, pattern_data)
+        raise error or _reference_race_error()
     
-    # Auto-generate initial tasks (next 30 days by default)
-    generate_until = datetime.utcnow() + timedelta(days=30)
-    await recurring_pattern_service.generate_task_instances(db, pattern.id, generate_until)
+    # Commit before responding so the background generation can see the pattern
     await db.commit()
     
+    # Auto-generate initial tasks (next 30 days by default) after the response
+    background_tasks.add_task(
+        recurring_pattern_service.generate_task_instances_in_background, pattern.id, 30
+    )
+    
     return pattern
 
 
+@router.post("/batch", response_model=List[RecurringPatternWithDetails], status_code=status.HTTP_201_CREATED)
+async def create_recurring_patterns(
+    batch: RecurringPatternBatchCreate,
+    background_tasks: BackgroundTasks,
+    generate_days_ahead: Optional[int] = Query(
+        None,
+        ge=1,
+        le=365,
+        description="Generate tasks for the next N days before responding (default: 30 days, in the background)"
+    ),
+    db: AsyncSession = Depends(get_db)
+) -> List[RecurringPatternWithDetails]:
+    """
+    Create several recurring patterns in one request and one INSERT (all or nothing).
+    
+    With generate_days_ahead the first tasks are generated in the same
+    transaction, so they can be listed as soon as this returns - no separate
+    generate call needed.
+    """
+    try:
+        patterns = await recurring_pattern_service.create_recurring_patterns(db, batch.patterns)
+    except IntegrityError as exc:
+        await db.rollback()
+        if reference_service.violated_constraint(exc) not in _PATTERN_REFERENCE_FKEYS:
+            raise
+        for pattern_data in batch.patterns:
+            error = await _missing_reference_error(db, pattern_data)
+            if error:
+                raise error
+        # All references exist now; one was created or deleted in between
+        raise _reference_race_error()
+    
+    if generate_days_ahead is not None:
+        await recurring_pattern_service.generate_all_due_instances(
+            db, generate_days_ahead, pattern_ids=[pattern.id for pattern in patterns]
+        )
+        await db.commit()
+        return patterns
+    
+    # Commit before responding so the background generation can see the patterns
+    await db.commit()
+    
+    for pattern in patterns:
+        background_tasks.add_task(
+            recurring_pattern_service.generate_task_instances_in_background, pattern.id, 30
+        )
+    
+    return patterns
+
+
 @router.put("/{pattern_id}", response_model=RecurringPatternWithDetails)
 async def update_recurring_pattern(
     pattern_id: int,
@@ -109,21 +230,23 @@ async def update_recurring_pattern(
     If update_future_tasks=true, all existing future incomplete tasks will also be updated with the new values.
     This is useful when you change the time, assignee, or title and want existing tasks to reflect the change.
     """
-    # Verify default assignee exists if being changed
-    if pattern_data.default_assignee_user_id:
-        assignee = await user_service.get_user_by_id(db, pattern_data.default_assignee_user_id)
-        if not assignee:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with id {pattern_data.default_assignee_user_id} not found"
-            )
-    
-    pattern = await recurring_pattern_service.update_recurring_pattern(
-        db, 
-        pattern_id, 
-        pattern_data,
-        update_future_tasks=update_future_tasks
-    )
+    # The assignee's FK is checked by the write itself (on the pattern, and on
+    # its future tasks with update_future_tasks)
+    try:
+        pattern = await recurring_pattern_service.update_recurring_pattern(
+            db, 
+            pattern_id, 
+            pattern_data,
+            update_future_tasks=update_future_tasks
+        )
+    except IntegrityError as exc:
+        await db.rollback()
+        if reference_service.violated_constraint(exc) not in _ASSIGNEE_FKEYS:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with id {pattern_data.default_assignee_user_id} not found"
+        )
     if not pattern:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -155,6 +278,21 @@ async def delete_recurring_pattern(
     await db.commit()
 
 
+@router.post("/generate")
+async def generate_all_task_instances(
+    days_ahead: int = Query(30, ge=1, le=365, description="Generate tasks for next N days"),
+    db: AsyncSession = Depends(get_db)
+) -> dict:
+    """
+    Generate task instances for every active pattern in one batch.
+    Meant to be hit by a periodic job (e.g. Cloud Scheduler) to keep all patterns topped up.
+    """
+    created = await recurring_pattern_service.generate_all_due_instances(db, days_ahead)
+    await db.commit()
+    
+    return {"created": created}
+
+
 @router.post("/{pattern_id}/generate", response_model=List[TaskWithDetails])
 async def generate_task_instances(
     pattern_id: int,
@@ -165,65 +303,73 @@ async def generate_task_instances(
     Manually trigger generation of task instances for a recurring pattern.
     This is useful for generating tasks further into the future.
     """
-    pattern = await recurring_pattern_service.get_recurring_pattern_by_id(db, pattern_id)
-    if not pattern:
+    if not await recurring_pattern_service.recurring_pattern_exists(db, pattern_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring pattern with id {pattern_id} not found"
         )
     
-    generate_until = datetime.utcnow() + timedelta(days=days_ahead)
-    tasks = await recurring_pattern_service.generate_task_instances(db, pattern_id, generate_until)
+    tasks = await recurring_pattern_service.generate_task_instances(db, pattern_id, days_ahead)
     await db.commit()
     
     return tasks
 
 
-@router.get("/{pattern_id}/tasks", response_model=List[TaskWithDetails])
+@router.get(
+    "/{pattern_id}/tasks",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[TaskWithDetails]}}
+)
 async def get_pattern_tasks(
     pattern_id: int,
+    request: Request,
     include_completed: bool = Query(False, description="Include completed tasks"),
     db: AsyncSession = Depends(get_db)
-) -> List[TaskWithDetails]:
-    """Get all task instances for a recurring pattern"""
-    pattern = await recurring_pattern_service.get_recurring_pattern_by_id(db, pattern_id)
-    if not pattern:
+) -> Response:
+    """Get all task instances for a recurring pattern (streamed as a JSON array, honors If-None-Match)"""
+    if not await recurring_pattern_service.recurring_pattern_exists(db, pattern_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring pattern with id {pattern_id} not found"
         )
     
-    tasks = await recurring_pattern_service.get_tasks_for_pattern(
+    version = await recurring_pattern_service.get_pattern_tasks_version(db, pattern_id, include_completed)
+    etag = make_etag(*version)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    
+    tasks = recurring_pattern_service.stream_tasks_for_pattern(
         db, 
         pattern_id, 
         include_completed
     )
-    return tasks
+    response = stream_json_array(tasks, TaskWithDetails)
+    set_etag(response, etag)
+    return response
 
 
 @router.patch("/{pattern_id}/activate", response_model=RecurringPatternWithDetails)
 async def activate_recurring_pattern(
     pattern_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ) -> RecurringPatternWithDetails:
-    """Activate a recurring pattern and generate upcoming tasks"""
-    pattern = await recurring_pattern_service.get_recurring_pattern_by_id(db, pattern_id)
+    """Activate a recurring pattern; upcoming tasks are generated in the background"""
+    pattern = await recurring_pattern_service.set_recurring_pattern_active(db, pattern_id, True)
     if not pattern:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring pattern with id {pattern_id} not found"
         )
-    
-    pattern.is_active = True
-    await db.flush()
-    
-    # Generate tasks for next 30 days
-    generate_until = datetime.utcnow() + timedelta(days=30)
-    await recurring_pattern_service.generate_task_instances(db, pattern.id, generate_until)
     await db.commit()
     
-    await db.refresh(pattern)
-    await db.refresh(pattern, ["default_assignee", "created_by"])
+    # Generate tasks for next 30 days after the response
+    background_tasks.add_task(
+        recurring_pattern_service.generate_task_instances_in_background, pattern.id, 30
+    )
+    
+    # Relationships came back with the UPDATE and commit doesn't expire them
     return pattern
 
 
@@ -233,19 +379,15 @@ async def deactivate_recurring_pattern(
     db: AsyncSession = Depends(get_db)
 ) -> RecurringPatternWithDetails:
     """Deactivate a recurring pattern (stops generating new tasks)"""
-    pattern = await recurring_pattern_service.get_recurring_pattern_by_id(db, pattern_id)
+    pattern = await recurring_pattern_service.set_recurring_pattern_active(db, pattern_id, False)
     if not pattern:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recurring pattern with id {pattern_id} not found"
         )
-    
-    pattern.is_active = False
-    await db.flush()
     await db.commit()
     
-    await db.refresh(pattern)
-    await db.refresh(pattern, ["default_assignee", "created_by"])
+    # Relationships came back with the UPDATE and commit doesn't expire them
     return pattern
 
 
@@ -1,28 +1,53 @@
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas import Reminder, ReminderCreate, ReminderUpdate, ReminderWithUser
+from app.api.etag import make_etag, not_modified, set_etag, wants_revalidation
+from app.api.streaming import stream_json_array
 from app.core.database import get_db
-from app.services import reminder_service, task_service, user_service
+from app.services import reference_service, reminder_service, task_service
 
 router = APIRouter(tags=["reminders"])
 
-@router.get("/reminders", response_model=List[ReminderWithUser])
+@router.get(
+    "/reminders",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[ReminderWithUser]}}
+)
 async def get_reminders(
+    request: Request,
     task_id: Optional[int] = Query(None, description="Filter by task ID"),
     user_id: Optional[int] = Query(None, description="Filter by user ID"),
     sent: Optional[bool] = Query(None, description="Filter by sent status"),
     db: AsyncSession = Depends(get_db)
-) -> List[ReminderWithUser]:
-    """Get reminders with optional filters"""
-    reminders = await reminder_service.get_reminders(
+) -> Response:
+    """Get reminders with optional filters (streamed as a JSON array; tagged only on If-None-Match, see get_tasks)"""
+    etag = None
+    if wants_revalidation(request):
+        # Versioned before the rows are read (see get_tasks)
+        version = await reminder_service.get_reminders_list_version(
+            db,
+            task_id=task_id,
+            user_id=user_id,
+            sent=sent
+        )
+        etag = make_etag(*version)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+    
+    reminders = reminder_service.stream_reminders(
         db,
         task_id=task_id,
         user_id=user_id,
         sent=sent
     )
-    return reminders
+    response = stream_json_array(reminders, ReminderWithUser)
+    if etag:
+        set_etag(response, etag)
+    return response
 
 @router.get("/reminders/due", response_model=List[ReminderWithUser])
 async def get_due_reminders(
@@ -54,8 +79,7 @@ async def get_task_reminders(
 ) -> List[ReminderWithUser]:
     """Get all reminders for a specific task"""
     # Verify task exists
-    task = await task_service.get_task_by_id(db, task_id)
-    if not task:
+    if not await task_service.task_exists(db, task_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found"
@@ -71,23 +95,19 @@ async def create_reminder(
     db: AsyncSession = Depends(get_db)
 ) -> ReminderWithUser:
     """Create a new reminder for a task"""
-    # Verify task exists
-    task = await task_service.get_task_by_id(db, task_id)
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with id {task_id} not found"
-        )
-    
-    # Verify user exists
-    user = await user_service.get_user_by_id(db, reminder_data.user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"User with id {reminder_data.user_id} not found"
-        )
-    
-    reminder = await reminder_service.create_reminder(db, task_id, reminder_data)
+    # One INSERT; the FKs do the task/user checks and name the culprit
+    try:
+        reminder = await reminder_service.create_reminder(db, task_id, reminder_data)
+    except IntegrityError as exc:
+        await db.rollback()
+        constraint = reference_service.violated_constraint(exc)
+        if constraint == "reminders_task_id_fkey":
+            detail = f"Task with id {task_id} not found"
+        elif constraint == "reminders_user_id_fkey":
+            detail = f"User with id {reminder_data.user_id} not found"
+        else:
+            raise
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
     return reminder
 
 @router.put("/reminders/{reminder_id}", response_model=ReminderWithUser)
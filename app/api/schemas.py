@@ -4,22 +4,26 @@ from pydantic import BaseModel, Field, ConfigDict, field_validator
 import re
 from app.models.enums import MemberRole, TaskStatus, RecurrenceFrequency
 
+_E164_PATTERN = re.compile(r'^\+[1-9]\d{1,14}$')
+
 class UserBase(BaseModel):
     display_name: str = Field(..., min_length=1, max_length=100)
     phone_e164: str = Field(..., min_length=8, max_length=32, description="Phone in E.164 format (e.g., +972512345678)")
+
+class UserCreate(UserBase):
+    whatsapp_opt_in: bool = True
+    preferences: dict = Field(default_factory=dict)
     
+    # Input only: responses come from rows that already passed this check,
+    # so User/UserBase skip the per-row Python validator
     @field_validator("phone_e164")
     @classmethod
     def validate_phone_e164(cls, v: str) -> str:
         """Validate E.164 phone format"""
-        if not re.match(r'^\+[1-9]\d{1,14}$', v):
+        if not _E164_PATTERN.match(v):
             raise ValueError("Phone must be in E.164 format (e.g., +972512345678)")
         return v
 
-class UserCreate(UserBase):
-    whatsapp_opt_in: bool = True
-    preferences: dict = Field(default_factory=dict)
-
 class UserUpdate(BaseModel):
     display_name: str | None = Field(None, min_length=1, max_length=100)
     phone_e164: str | None = Field(None, min_length=8, max_length=32)
@@ -31,7 +35,7 @@ class UserUpdate(BaseModel):
     @classmethod
     def validate_phone_e164(cls, v: str | None) -> str | None:
         """Validate E.164 phone format"""
-        if v is not None and not re.match(r'^\+[1-9]\d{1,14}$', v):
+        if v is not None and not _E164_PATTERN.match(v):
             raise ValueError("Phone must be in E.164 format (e.g., +972512345678)")
         return v
 
@@ -205,6 +209,9 @@ class RecurringPatternCreate(RecurringPatternBase):
     created_by_user_id: Optional[int] = None
     is_active: bool = True
 
+class RecurringPatternBatchCreate(BaseModel):
+    patterns: list[RecurringPatternCreate] = Field(..., min_length=1, max_length=100)
+
 class RecurringPatternUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = None
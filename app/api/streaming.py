@@ -0,0 +1,26 @@
+from typing import Any, AsyncIterator, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+
+async def _encode_json_array(items: AsyncIterator[Any], schema: Type[BaseModel]) -> AsyncIterator[bytes]:
+    """Encode ORM rows as a JSON array one item at a time"""
+    yield b"["
+    first = True
+    async for item in items:
+        if not first:
+            yield b","
+        first = False
+        yield schema.model_validate(item).model_dump_json(by_alias=True).encode()
+    yield b"]"
+
+
+def stream_json_array(items: AsyncIterator[Any], schema: Type[BaseModel]) -> StreamingResponse:
+    """
+    Stream rows from a service's stream_*() generator as a JSON array.
+    
+    Each row is validated against the response schema and written as it comes
+    off the cursor, so only one batch is held in memory at a time.
+    """
+    return StreamingResponse(_encode_json_array(items, schema), media_type="application/json")
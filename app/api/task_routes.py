@@ -1,38 +1,73 @@
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas import Task, TaskCreate, TaskUpdate, TaskWithDetails
+from app.api.etag import make_etag, not_modified, set_etag, wants_revalidation
+from app.api.streaming import stream_json_array
 from app.core.database import get_db
-from app.services import task_service, family_service, user_service
+from app.services import task_service, reference_service
 from app.models.enums import TaskStatus
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
-@router.get("", response_model=List[TaskWithDetails])
+@router.get(
+    "",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[TaskWithDetails]}}
+)
 async def get_tasks(
+    request: Request,
     family_id: Optional[int] = Query(None, description="Filter by family ID"),
     status: Optional[TaskStatus] = Query(None, description="Filter by status"),
     assignee_user_id: Optional[int] = Query(None, description="Filter by assignee"),
     db: AsyncSession = Depends(get_db)
-) -> List[TaskWithDetails]:
-    """Get tasks with optional filters"""
-    tasks = await task_service.get_tasks(
+) -> Response:
+    """
+    Get tasks with optional filters (streamed as a JSON array).
+    
+    Only requests that send If-None-Match pay for the version query; they get
+    a 304 or the list with its ETag. Plain requests get the list untagged.
+    """
+    etag = None
+    if wants_revalidation(request):
+        # Versioned before the rows are read, so a concurrent write can only make
+        # the ETag older than the body (costing the client a refetch), never newer
+        version = await task_service.get_tasks_list_version(
+            db,
+            family_id=family_id,
+            status=status,
+            assignee_user_id=assignee_user_id
+        )
+        etag = make_etag(*version)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+    
+    tasks = task_service.stream_tasks(
         db,
         family_id=family_id,
         status=status,
         assignee_user_id=assignee_user_id
     )
-    return tasks
+    response = stream_json_array(tasks, TaskWithDetails)
+    if etag:
+        set_etag(response, etag)
+    return response
 
-@router.get("/overdue", response_model=List[TaskWithDetails])
+@router.get(
+    "/overdue",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[TaskWithDetails]}}
+)
 async def get_overdue_tasks(
     family_id: Optional[int] = Query(None, description="Filter by family ID"),
     db: AsyncSession = Depends(get_db)
-) -> List[TaskWithDetails]:
-    """Get tasks that are overdue"""
-    tasks = await task_service.get_overdue_tasks(db, family_id=family_id)
-    return tasks
+) -> Response:
+    """Get tasks that are overdue (streamed as a JSON array)"""
+    tasks = task_service.stream_overdue_tasks(db, family_id=family_id)
+    return stream_json_array(tasks, TaskWithDetails)
 
 @router.get("/{task_id}", response_model=TaskWithDetails)
 async def get_task(task_id: int, db: AsyncSession = Depends(get_db)) -> TaskWithDetails:
@@ -51,33 +86,21 @@ async def create_task(
     db: AsyncSession = Depends(get_db)
 ) -> TaskWithDetails:
     """Create a new task"""
-    # Verify family exists
-    family = await family_service.get_family_by_id(db, task_data.family_id)
-    if not family:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Family with id {task_data.family_id} not found"
-        )
-    
-    # Verify assignee exists if provided
-    if task_data.assignee_user_id:
-        assignee = await user_service.get_user_by_id(db, task_data.assignee_user_id)
-        if not assignee:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with id {task_data.assignee_user_id} not found"
-            )
-    
-    # Verify creator exists if provided
-    if task_data.created_by_user_id:
-        creator = await user_service.get_user_by_id(db, task_data.created_by_user_id)
-        if not creator:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Creator user with id {task_data.created_by_user_id} not found"
-            )
-    
-    task = await task_service.create_task(db, task_data, task_data.created_by_user_id)
+    # One INSERT; the FKs do the family/user checks and name the culprit
+    try:
+        task = await task_service.create_task(db, task_data, task_data.created_by_user_id)
+    except IntegrityError as exc:
+        await db.rollback()
+        constraint = reference_service.violated_constraint(exc)
+        if constraint == "tasks_family_id_fkey":
+            detail = f"Family with id {task_data.family_id} not found"
+        elif constraint == "tasks_assignee_user_id_fkey":
+            detail = f"User with id {task_data.assignee_user_id} not found"
+        elif constraint == "tasks_created_by_user_id_fkey":
+            detail = f"Creator user with id {task_data.created_by_user_id} not found"
+        else:
+            raise
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
     return task
 
 @router.put("/{task_id}", response_model=TaskWithDetails)
@@ -87,16 +110,17 @@ async def update_task(
     db: AsyncSession = Depends(get_db)
 ) -> TaskWithDetails:
     """Update an existing task"""
-    # Verify assignee exists if being changed
-    if task_data.assignee_user_id:
-        assignee = await user_service.get_user_by_id(db, task_data.assignee_user_id)
-        if not assignee:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with id {task_data.assignee_user_id} not found"
-            )
-    
-    task = await task_service.update_task(db, task_id, task_data)
+    # The assignee's FK is checked by the UPDATE itself
+    try:
+        task = await task_service.update_task(db, task_id, task_data)
+    except IntegrityError as exc:
+        await db.rollback()
+        if reference_service.violated_constraint(exc) != "tasks_assignee_user_id_fkey":
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with id {task_data.assignee_user_id} not found"
+        )
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
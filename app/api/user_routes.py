@@ -1,18 +1,39 @@
 from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas import User, UserCreate, UserUpdate
+from app.api.etag import make_etag, not_modified, set_etag, wants_revalidation
+from app.api.streaming import stream_json_array
 from app.core.database import get_db
-from app.services import user_service
+from app.services import reference_service, user_service
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-@router.get("", response_model=List[User])
-async def get_users(db: AsyncSession = Depends(get_db)) -> List[User]:
-    """Get all users"""
-    users = await user_service.get_users(db)
-    return users
+@router.get(
+    "",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[User]}}
+)
+async def get_users(
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+) -> Response:
+    """Get all users (streamed as a JSON array; tagged only on If-None-Match, see get_tasks)"""
+    etag = None
+    if wants_revalidation(request):
+        # Versioned before the rows are read (see task_routes.get_tasks)
+        version = await user_service.get_users_list_version(db)
+        etag = make_etag(*version)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+    
+    response = stream_json_array(user_service.stream_users(db), User)
+    if etag:
+        set_etag(response, etag)
+    return response
 
 @router.get("/{user_id}", response_model=User)
 async def get_user(user_id: int, db: AsyncSession = Depends(get_db)) -> User:
@@ -39,14 +60,17 @@ async def get_user_by_phone(phone_e164: str, db: AsyncSession = Depends(get_db))
 @router.post("", response_model=User, status_code=status.HTTP_201_CREATED)
 async def create_user(user_data: UserCreate, db: AsyncSession = Depends(get_db)) -> User:
     """Create a new user"""
-    existing_user = await user_service.get_user_by_phone(db, user_data.phone_e164)
-    if existing_user:
+    # One INSERT; uq_users_phone rejects duplicates without a lookup first
+    try:
+        user = await user_service.create_user(db, user_data)
+    except IntegrityError as exc:
+        await db.rollback()
+        if reference_service.violated_constraint(exc) != "uq_users_phone":
+            raise
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"User with phone {user_data.phone_e164} already exists"
         )
-    
-    user = await user_service.create_user(db, user_data)
     return user
 
 @router.put("/{user_id}", response_model=User)
@@ -56,16 +80,18 @@ async def update_user(
     db: AsyncSession = Depends(get_db)
 ) -> User:
     """Update an existing user"""
-    # Check if phone is being changed to an existing phone
-    if user_data.phone_e164:
-        existing_user = await user_service.get_user_by_phone(db, user_data.phone_e164)
-        if existing_user and existing_user.id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"User with phone {user_data.phone_e164} already exists"
-            )
+    # One UPDATE; uq_users_phone rejects a phone that belongs to someone else
+    try:
+        user = await user_service.update_user(db, user_id, user_data)
+    except IntegrityError as exc:
+        await db.rollback()
+        if reference_service.violated_constraint(exc) != "uq_users_phone":
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"User with phone {user_data.phone_e164} already exists"
+        )
     
-    user = await user_service.update_user(db, user_id, user_data)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
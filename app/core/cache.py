@@ -0,0 +1,39 @@
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Tiny in-process cache whose entries expire after a fixed TTL.
+
+    Lives per worker process (not shared between instances), so only cache
+    values where being stale for `ttl_seconds` is acceptable. No locking is
+    needed: get/set never await, so they can't interleave on the event loop.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 4096):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[Any, float]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if key not in self._data and len(self._data) >= self.maxsize:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._data[next(iter(self._data))]
+        self._data[key] = (value, time.monotonic() + self.ttl_seconds)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
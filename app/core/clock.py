@@ -0,0 +1,10 @@
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """
+    Current UTC time as a naive datetime, matching the naive UTC DateTime columns.
+
+    Replaces datetime.utcnow(), which is deprecated since Python 3.12.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
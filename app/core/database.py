@@ -1,5 +1,6 @@
+import asyncio
 from typing import AsyncGenerator
-from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -11,30 +12,11 @@ def clean_database_url(url: str) -> str:
     """
     Convert database URL for asyncpg compatibility.
     - Changes postgresql:// to postgresql+asyncpg://
-    - Removes query parameters that asyncpg doesn't support
-    - Keeps only ssl-related parameters that asyncpg understands
+    - Drops the query string (e.g. Neon's ?sslmode=require&channel_binding=...),
+      which asyncpg doesn't accept; it negotiates SSL with remote hosts itself
     """
-    # Convert to asyncpg dialect
-    url = url.replace("postgresql://", "postgresql+asyncpg://")
-    
-    # Parse the URL
-    parsed = urlparse(url)
-    
-    # Remove query parameters (asyncpg will use SSL by default for remote hosts)
-    # For Neon, SSL is automatically handled
-    if parsed.query:
-        # Remove all query params - asyncpg will auto-detect SSL need
-        clean_url = urlunparse((
-            parsed.scheme,
-            parsed.netloc,
-            parsed.path,
-            parsed.params,
-            '',  # Empty query string
-            parsed.fragment
-        ))
-        return clean_url
-    
-    return url
+    url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url.split("?", 1)[0]
 
 # Convert and clean the database URL
 database_url = clean_database_url(settings.database_url)
@@ -43,13 +25,29 @@ engine = create_async_engine(
     database_url,
     echo=settings.database_echo,
     future=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    # Checkouts after an idle spell (Neon suspends compute) get a live socket
+    pool_pre_ping=True,
+    connect_args={
+        "timeout": settings.db_connect_timeout,
+        "command_timeout": settings.db_command_timeout,
+        # Room for every distinct statement the app issues (filter variants
+        # included), so hot queries stay prepared instead of being evicted
+        # from the default 100 slots
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+        "statement_cache_size": settings.db_statement_cache_size,
+        "server_settings": {"application_name": settings.app_name},
+    },
 )
 
+# expire_on_commit=False: rows returned by INSERT/UPDATE ... RETURNING stay
+# loaded after the route commits, so nothing needs a refresh() to serialize
 async_session_factory = async_sessionmaker(
     engine,
-    class_=AsyncSession,
     expire_on_commit=False,
-    autocommit=False,
     autoflush=False,
 )
 
@@ -60,17 +58,31 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         try:
             yield session
-            await session.commit()
+            # Routes that never queried, or already committed, have nothing
+            # to finish; commit() would autobegin an empty transaction first
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 async def init_db() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+async def warm_pool(size: int = settings.db_pool_size) -> None:
+    """
+    Open `size` pooled connections up front, concurrently.
+    
+    Holding them all at once forces the pool to create each one, so the
+    TCP/TLS/auth handshakes happen here instead of on the first requests.
+    """
+    async def _probe() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    
+    await asyncio.gather(*(_probe() for _ in range(size)))
+
 async def close_db() -> None:
     await engine.dispose()
 
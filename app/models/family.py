@@ -11,4 +11,6 @@ class Family(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String(120), nullable=False)
 
     # convenience relationships
-    memberships: Mapped[list["FamilyMember"]] = relationship(back_populates="family", cascade="all, delete-orphan")
\ No newline at end of file
+    memberships: Mapped[list["FamilyMember"]] = relationship(
+        back_populates="family", cascade="all, delete-orphan", order_by="FamilyMember.id"
+    )
\ No newline at end of file
@@ -22,7 +22,7 @@ class RecurringPattern(Base, TimestampMixin):
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    family_id: Mapped[int] = mapped_column(ForeignKey("families.id", ondelete="CASCADE"), nullable=False, index=True)
+    family_id: Mapped[int] = mapped_column(ForeignKey("families.id", ondelete="CASCADE"), nullable=False)
     
     # Core pattern definition
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -71,8 +71,12 @@ class RecurringPattern(Base, TimestampMixin):
     # Additional metadata
     meta: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
     
-    # Relationships
-    default_assignee: Mapped[Optional["User"]] = relationship(foreign_keys=[default_assignee_user_id])
-    created_by: Mapped[Optional["User"]] = relationship(foreign_keys=[created_by_user_id])
+    # Relationships (lazy="raise": always load them explicitly, e.g. via selectinload)
+    default_assignee: Mapped[Optional["User"]] = relationship(
+        foreign_keys=[default_assignee_user_id], lazy="raise"
+    )
+    created_by: Mapped[Optional["User"]] = relationship(
+        foreign_keys=[created_by_user_id], lazy="raise"
+    )
     tasks: Mapped[list["Task"]] = relationship(back_populates="recurring_pattern", cascade="all, delete-orphan")
 
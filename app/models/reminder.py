@@ -1,4 +1,4 @@
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 from app.models.timestamps import TimestampMixin
@@ -16,16 +16,17 @@ class Reminder(Base, TimestampMixin):
     """
     __tablename__ = "reminders"
     __table_args__ = (
-        Index("ix_reminders_due_unsent", "due_at", "sent_at"),
+        # Only unsent reminders, in due order: get_due_reminders() stops after LIMIT rows
+        Index("ix_reminders_due_pending", "due_at", postgresql_where=text("sent_at IS NULL")),
         Index("ix_reminders_task_user", "task_id", "user_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
+    task_id: Mapped[int] = mapped_column(ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # when to send
-    due_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    due_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     # when actually sent (null = not yet)
     sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
@@ -33,4 +34,5 @@ class Reminder(Base, TimestampMixin):
     payload: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
     
     # relationships
-    user: Mapped["User"] = relationship()
\ No newline at end of file
+    # lazy="raise": always eager-load (selectinload) so lists can't N+1
+    user: Mapped["User"] = relationship(lazy="raise")
\ No newline at end of file
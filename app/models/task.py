@@ -1,4 +1,4 @@
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text, Date
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, Date, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 from app.models.timestamps import TimestampMixin
@@ -13,15 +13,22 @@ class Task(Base, TimestampMixin):
     __tablename__ = "tasks"
     __table_args__ = (
         Index("ix_tasks_family_status_due", "family_id", "status", "due_at"),
-        Index("ix_tasks_recurring_pattern", "recurring_pattern_id", "occurrence_date"),
+        # One instance per pattern per date; generate_task_instances relies on
+        # it for ON CONFLICT DO NOTHING. Ad-hoc tasks (NULL pattern) never clash.
+        Index("uq_tasks_pattern_occurrence", "recurring_pattern_id", "occurrence_date", unique=True),
+        # Open instances only; must match the filter in stream_tasks_for_pattern
+        Index(
+            "ix_tasks_pattern_active", "recurring_pattern_id", "occurrence_date",
+            postgresql_where=text("status <> 'done'"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    family_id: Mapped[int] = mapped_column(ForeignKey("families.id", ondelete="CASCADE"), nullable=False, index=True)
+    family_id: Mapped[int] = mapped_column(ForeignKey("families.id", ondelete="CASCADE"), nullable=False)
     
     # Link to recurring pattern if this is a generated instance
     recurring_pattern_id: Mapped[Optional[int]] = mapped_column(
-        ForeignKey("recurring_patterns.id", ondelete="CASCADE"), index=True
+        ForeignKey("recurring_patterns.id", ondelete="CASCADE")
     )
     
     # The specific date this task instance is for (if recurring)
@@ -44,6 +51,7 @@ class Task(Base, TimestampMixin):
 
     meta: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
 
-    created_by: Mapped[Optional["User"]] = relationship(foreign_keys=[created_by_user_id])
-    assignee: Mapped[Optional["User"]] = relationship(foreign_keys=[assignee_user_id])
+    # lazy="raise": always eager-load these (selectinload) so lists can't N+1
+    created_by: Mapped[Optional["User"]] = relationship(foreign_keys=[created_by_user_id], lazy="raise")
+    assignee: Mapped[Optional["User"]] = relationship(foreign_keys=[assignee_user_id], lazy="raise")
     recurring_pattern: Mapped[Optional["RecurringPattern"]] = relationship(back_populates="tasks")
\ No newline at end of file
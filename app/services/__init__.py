@@ -5,6 +5,7 @@ from app.services import family_member_service
 from app.services import task_service
 from app.services import reminder_service
 from app.services import recurring_pattern_service
+from app.services import reference_service
 
 __all__ = [
     "user_service",
@@ -13,5 +14,6 @@ __all__ = [
     "task_service",
     "reminder_service",
     "recurring_pattern_service",
+    "reference_service",
 ]
 
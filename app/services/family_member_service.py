@@ -1,18 +1,35 @@
 from typing import List, Optional
-from sqlalchemy import select, and_
+from sqlalchemy import select, bindparam, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.models.family_member import FamilyMember as FamilyMemberModel
 from app.api.schemas import FamilyMemberCreate, FamilyMemberUpdate
+from app.core.clock import utcnow
+from app.services.reference_service import build_guarded_insert, family_exists_clause, user_exists_clause
 
+# Hot lookup is built once; each call only binds :member_id
+_get_family_member_by_id_stmt = (
+    select(FamilyMemberModel)
+    .where(FamilyMemberModel.id == bindparam("member_id"))
+    .options(joinedload(FamilyMemberModel.user))
+)
 
-async def get_family_members(db: AsyncSession, family_id: int) -> List[FamilyMemberModel]:
-    """Get all members of a family"""
+
+async def get_family_members(
+    db: AsyncSession,
+    family_id: int,
+    limit: int = 50,
+    offset: int = 0
+) -> List[FamilyMemberModel]:
+    """Get a page of members of a family"""
     result = await db.execute(
         select(FamilyMemberModel)
         .where(FamilyMemberModel.family_id == family_id)
         .options(selectinload(FamilyMemberModel.user))
+        .order_by(FamilyMemberModel.id)
+        .limit(limit)
+        .offset(offset)
     )
     return list(result.scalars().all())
 
@@ -27,29 +44,8 @@ async def get_user_families(db: AsyncSession, user_id: int) -> List[FamilyMember
 
 
 async def get_family_member_by_id(db: AsyncSession, member_id: int) -> Optional[FamilyMemberModel]:
-    """Get a specific family member by ID"""
-    result = await db.execute(
-        select(FamilyMemberModel)
-        .where(FamilyMemberModel.id == member_id)
-        .options(selectinload(FamilyMemberModel.user))
-    )
-    return result.scalar_one_or_none()
-
-
-async def get_family_member_by_user(
-    db: AsyncSession, 
-    family_id: int, 
-    user_id: int
-) -> Optional[FamilyMemberModel]:
-    """Check if a user is already a member of a family"""
-    result = await db.execute(
-        select(FamilyMemberModel).where(
-            and_(
-                FamilyMemberModel.family_id == family_id,
-                FamilyMemberModel.user_id == user_id
-            )
-        )
-    )
+    """Get a specific family member by ID (user joined in, one round-trip)"""
+    result = await db.execute(_get_family_member_by_id_stmt, {"member_id": member_id})
     return result.scalar_one_or_none()
 
 
@@ -57,20 +53,39 @@ async def create_family_member(
     db: AsyncSession,
     family_id: int,
     member_data: FamilyMemberCreate
-) -> FamilyMemberModel:
-    """Add a user to a family with a specific role"""
-    member = FamilyMemberModel(
-        family_id=family_id,
-        user_id=member_data.user_id,
-        role=member_data.role
+) -> Optional[FamilyMemberModel]:
+    """
+    Add a user to a family with a specific role.
+
+    The family/user existence checks and the duplicate-member check are folded
+    into the INSERT itself (INSERT ... SELECT WHERE EXISTS ... ON CONFLICT DO
+    NOTHING), so the happy path is a single statement and concurrent adds
+    cannot race into a unique-constraint error.
+
+    Returns:
+        The new member, or None if the family or user doesn't exist or the
+        user is already a member
+    """
+    now = utcnow()
+    stmt = (
+        build_guarded_insert(
+            FamilyMemberModel,
+            {
+                "family_id": family_id,
+                "user_id": member_data.user_id,
+                "role": member_data.role,
+                "created_at": now,
+                "updated_at": now,
+            },
+            family_exists_clause(family_id),
+            user_exists_clause(member_data.user_id),
+        )
+        .on_conflict_do_nothing(constraint="uq_family_user")
+        .returning(FamilyMemberModel)
+        .options(selectinload(FamilyMemberModel.user))
     )
-    db.add(member)
-    await db.flush()
-    await db.refresh(member)
-    
-    # Load relationship
-    await db.refresh(member, ["user"])
-    return member
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
 
 
 async def update_family_member(
@@ -78,18 +93,19 @@ async def update_family_member(
     member_id: int,
     member_data: FamilyMemberUpdate
 ) -> Optional[FamilyMemberModel]:
-    """Update a family member's role"""
-    member = await get_family_member_by_id(db, member_id)
-    if not member:
-        return None
+    """Update a family member's role (UPDATE ... RETURNING, no refresh needed)"""
+    if member_data.role is None:
+        return await get_family_member_by_id(db, member_id)
     
-    if member_data.role is not None:
-        member.role = member_data.role
-    
-    await db.flush()
-    await db.refresh(member)
-    await db.refresh(member, ["user"])
-    return member
+    result = await db.execute(
+        update(FamilyMemberModel)
+        .where(FamilyMemberModel.id == member_id)
+        .values(role=member_data.role)
+        .returning(FamilyMemberModel)
+        .options(selectinload(FamilyMemberModel.user))
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
 
 
 async def delete_family_member(db: AsyncSession, member_id: int) -> bool:
@@ -1,53 +1,85 @@
 from typing import List, Optional
-from sqlalchemy import select
+from datetime import datetime
+from sqlalchemy import select, exists, bindparam, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
+from app.core.cache import TTLCache
+from app.core.config import get_settings
 from app.models.family import Family as FamilyModel
 from app.models.family_member import FamilyMember as FamilyMemberModel
 from app.api.schemas import FamilyCreate, FamilyUpdate
 
-async def get_families(db: AsyncSession) -> List[FamilyModel]:
-    """Get all families"""
-    result = await db.execute(select(FamilyModel))
+# Only positive lookups are cached, so a freshly created family is never 404'd
+_family_exists_cache = TTLCache(get_settings().existence_cache_ttl_seconds)
+
+# Hot lookup is built once; each call only binds :family_id
+_family_exists_stmt = select(exists().where(FamilyModel.id == bindparam("family_id")))
+
+async def get_families(db: AsyncSession, limit: int = 50, offset: int = 0) -> List[FamilyModel]:
+    """Get a page of families"""
+    result = await db.execute(
+        select(FamilyModel)
+        .order_by(FamilyModel.id)
+        .limit(limit)
+        .offset(offset)
+    )
     return list(result.scalars().all())
 
 async def get_family_by_id(db: AsyncSession, family_id: int) -> Optional[FamilyModel]:
-    """Get a family by ID"""
-    result = await db.execute(select(FamilyModel).where(FamilyModel.id == family_id))
-    return result.scalar_one_or_none()
+    """
+    Get a family by ID.
+    
+    Uses the session's identity map first, so repeat lookups within one
+    request (one session) don't hit the database again.
+    """
+    return await db.get(FamilyModel, family_id)
+
+async def get_family_updated_at(db: AsyncSession, family_id: int) -> Optional[datetime]:
+    """Get just a family's updated_at (None if it doesn't exist), for ETag checks"""
+    return await db.scalar(select(FamilyModel.updated_at).where(FamilyModel.id == family_id))
+
+async def family_exists(db: AsyncSession, family_id: int) -> bool:
+    """Check whether a family exists (cached for a few seconds per worker)"""
+    if _family_exists_cache.get(family_id):
+        return True
+    
+    found = bool(await db.scalar(_family_exists_stmt, {"family_id": family_id}))
+    if found:
+        _family_exists_cache.set(family_id, True)
+    return found
 
 async def get_family_with_members(db: AsyncSession, family_id: int) -> Optional[FamilyModel]:
-    """Get a family by ID with all members loaded"""
+    """Get a family by ID with all members loaded (one JOINed query)"""
     result = await db.execute(
         select(FamilyModel)
         .where(FamilyModel.id == family_id)
-        .options(selectinload(FamilyModel.memberships).selectinload(FamilyMemberModel.user))
+        .options(joinedload(FamilyModel.memberships).joinedload(FamilyMemberModel.user))
     )
-    return result.scalar_one_or_none()
+    return result.unique().scalar_one_or_none()
 
 async def create_family(db: AsyncSession, family_data: FamilyCreate) -> FamilyModel:
-    """Create a new family"""
-    family = FamilyModel(
-        name=family_data.name,
+    """Create a new family (INSERT ... RETURNING, no refresh needed)"""
+    result = await db.execute(
+        insert(FamilyModel)
+        .values(name=family_data.name)
+        .returning(FamilyModel)
     )
-    db.add(family)
-    await db.flush()
-    await db.refresh(family)
-    return family
+    return result.scalar_one()
 
 async def update_family(db: AsyncSession, family_id: int, family_data: FamilyUpdate) -> Optional[FamilyModel]:
-    """Update an existing family"""
-    family = await get_family_by_id(db, family_id)
-    if not family:
-        return None
-    
-    if family_data.name is not None:
-        family.name = family_data.name
+    """Update an existing family (UPDATE ... RETURNING, no refresh needed)"""
+    if family_data.name is None:
+        return await get_family_by_id(db, family_id)
     
-    await db.flush()
-    await db.refresh(family)
-    return family
+    result = await db.execute(
+        update(FamilyModel)
+        .where(FamilyModel.id == family_id)
+        .values(name=family_data.name)
+        .returning(FamilyModel)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
 
 async def delete_family(db: AsyncSession, family_id: int) -> bool:
     """Delete a family (will cascade delete all members)"""
@@ -57,6 +89,7 @@ async def delete_family(db: AsyncSession, family_id: int) -> bool:
     
     await db.delete(family)
     await db.flush()
+    _family_exists_cache.pop(family_id)
     return True
 
 
@@ -17,14 +17,16 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timezone
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 from zoneinfo import ZoneInfo
 
-from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
 
 from app.core.config import get_settings
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 TZ = ZoneInfo("Asia/Jerusalem")
 
 
@@ -306,6 +308,10 @@ _client: AsyncOpenAI | None = None
 def _get_client() -> AsyncOpenAI:
     global _client
     if _client is None:
+        # The openai package takes ~0.4s to import; only pay it once the bot
+        # actually has a message to parse, not on every cold start
+        from openai import AsyncOpenAI
+
         s = get_settings()
         _client = AsyncOpenAI(api_key=s.openai_api_key)
     return _client
@@ -1,91 +1,242 @@
-from typing import List, Optional
-from sqlalchemy import select, and_
+import logging
+from collections import defaultdict
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
+from sqlalchemy import select, and_, or_, delete, insert, update, bindparam, exists, func, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from datetime import datetime, timedelta, date
+from sqlalchemy.orm import aliased, joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from datetime import datetime, time, timedelta, date
 from dateutil.relativedelta import relativedelta
 
 from app.models.recurring_pattern import RecurringPattern as RecurringPatternModel
 from app.models.task import Task as TaskModel
+from app.models.user import User as UserModel
 from app.models.enums import RecurrenceFrequency, TaskStatus
 from app.api.schemas import RecurringPatternCreate, RecurringPatternUpdate
+from app.core.clock import utcnow
+from app.core.database import async_session_factory
+from app.services.reference_service import build_guarded_insert, family_exists_clause, user_exists_clause
+
+log = logging.getLogger(__name__)
+
+
+# Hot lookup is built once; each call only binds :pattern_id
+_get_recurring_pattern_by_id_stmt = (
+    select(RecurringPatternModel)
+    .where(RecurringPatternModel.id == bindparam("pattern_id"))
+    .options(
+        joinedload(RecurringPatternModel.default_assignee),
+        joinedload(RecurringPatternModel.created_by)
+    )
+)
+_recurring_pattern_exists_stmt = select(
+    exists().where(RecurringPatternModel.id == bindparam("pattern_id"))
+)
 
 
 async def get_recurring_patterns(
     db: AsyncSession,
     family_id: Optional[int] = None,
-    is_active: Optional[bool] = None
+    is_active: Optional[bool] = None,
+    limit: int = 50,
+    offset: int = 0
 ) -> List[RecurringPatternModel]:
-    """Get recurring patterns with optional filters"""
+    """Get a page of recurring patterns with optional filters"""
     query = select(RecurringPatternModel).options(
         selectinload(RecurringPatternModel.default_assignee),
-        selectinload(RecurringPatternModel.created_by)
+        selectinload(RecurringPatternModel.created_by),
+        # Pattern.tasks is lazy="select" for the delete cascade; never load it in lists
+        raiseload("*", sql_only=True)
     )
     
-    filters = []
-    if family_id is not None:
-        filters.append(RecurringPatternModel.family_id == family_id)
-    if is_active is not None:
-        filters.append(RecurringPatternModel.is_active == is_active)
-    
+    filters = _recurring_pattern_filters(family_id, is_active)
     if filters:
         query = query.where(and_(*filters))
     
+    query = query.order_by(RecurringPatternModel.id).limit(limit).offset(offset)
     result = await db.execute(query)
     return list(result.scalars().all())
 
 
+async def get_recurring_patterns_list_version(
+    db: AsyncSession,
+    family_id: Optional[int] = None,
+    is_active: Optional[bool] = None
+) -> Tuple[int, int, Optional[datetime]]:
+    """
+    Version of every get_recurring_patterns() page for these filters, for ETags.
+    
+    Returns (pattern count, linked assignee/creator count, newest updated_at
+    across the patterns and those users). Covers the whole filtered set, so
+    any change to it invalidates every page.
+    """
+    assignee = aliased(UserModel)
+    creator = aliased(UserModel)
+    query = (
+        select(
+            func.count(RecurringPatternModel.id),
+            func.count(assignee.id) + func.count(creator.id),
+            func.greatest(
+                func.max(RecurringPatternModel.updated_at),
+                func.max(assignee.updated_at),
+                func.max(creator.updated_at)
+            )
+        )
+        .select_from(RecurringPatternModel)
+        .outerjoin(assignee, RecurringPatternModel.default_assignee_user_id == assignee.id)
+        .outerjoin(creator, RecurringPatternModel.created_by_user_id == creator.id)
+    )
+    
+    filters = _recurring_pattern_filters(family_id, is_active)
+    if filters:
+        query = query.where(and_(*filters))
+    
+    result = await db.execute(query)
+    return tuple(result.one())
+
+
+def _recurring_pattern_filters(family_id: Optional[int], is_active: Optional[bool]) -> list:
+    """WHERE clauses shared by get_recurring_patterns and get_recurring_patterns_list_version"""
+    filters = []
+    if family_id is not None:
+        filters.append(RecurringPatternModel.family_id == family_id)
+    if is_active is not None:
+        filters.append(RecurringPatternModel.is_active == is_active)
+    return filters
+
+
 async def get_recurring_pattern_by_id(
     db: AsyncSession, 
     pattern_id: int
 ) -> Optional[RecurringPatternModel]:
     """Get a recurring pattern by ID with relationships loaded"""
+    result = await db.execute(_get_recurring_pattern_by_id_stmt, {"pattern_id": pattern_id})
+    return result.scalar_one_or_none()
+
+
+async def get_recurring_pattern_updated_at(
+    db: AsyncSession,
+    pattern_id: int
+) -> Optional[Tuple[datetime, Optional[datetime], Optional[datetime]]]:
+    """
+    Get the updated_at stamps behind a RecurringPatternWithDetails response.
+
+    Returns (pattern, default assignee, creator) stamps in one lightweight
+    query, or None if the pattern doesn't exist. Used for ETag checks.
+    """
+    assignee = aliased(UserModel)
+    creator = aliased(UserModel)
     result = await db.execute(
-        select(RecurringPatternModel)
+        select(RecurringPatternModel.updated_at, assignee.updated_at, creator.updated_at)
+        .outerjoin(assignee, RecurringPatternModel.default_assignee_user_id == assignee.id)
+        .outerjoin(creator, RecurringPatternModel.created_by_user_id == creator.id)
         .where(RecurringPatternModel.id == pattern_id)
-        .options(
-            selectinload(RecurringPatternModel.default_assignee),
-            selectinload(RecurringPatternModel.created_by)
-        )
     )
-    return result.scalar_one_or_none()
+    row = result.one_or_none()
+    return tuple(row) if row else None
+
+
+async def recurring_pattern_exists(db: AsyncSession, pattern_id: int) -> bool:
+    """Check whether a recurring pattern exists without loading it"""
+    return bool(await db.scalar(_recurring_pattern_exists_stmt, {"pattern_id": pattern_id}))
 
 
 async def create_recurring_pattern(
     db: AsyncSession,
     pattern_data: RecurringPatternCreate,
     created_by_user_id: Optional[int] = None
-) -> RecurringPatternModel:
-    """Create a new recurring pattern"""
-    # Remove timezone info if present
-    start_date = pattern_data.start_date.replace(tzinfo=None) if pattern_data.start_date else None
-    end_date = pattern_data.end_date.replace(tzinfo=None) if pattern_data.end_date else None
-    
-    pattern = RecurringPatternModel(
-        family_id=pattern_data.family_id,
-        title=pattern_data.title,
-        description=pattern_data.description,
-        frequency=pattern_data.frequency,
-        interval=pattern_data.interval,
-        by_day=pattern_data.by_day,
-        start_time_hour=pattern_data.start_time_hour,
-        start_time_minute=pattern_data.start_time_minute,
-        duration_minutes=pattern_data.duration_minutes,
-        start_date=start_date,
-        end_date=end_date,
-        default_assignee_user_id=pattern_data.default_assignee_user_id,
-        created_by_user_id=created_by_user_id,
-        is_active=pattern_data.is_active,
-        meta=pattern_data.meta or {},
+) -> Optional[RecurringPatternModel]:
+    """
+    Create a new recurring pattern.
+    
+    The family, default assignee and creator existence checks are part of the
+    INSERT itself (INSERT ... SELECT WHERE EXISTS ...), so this is a single
+    statement on the happy path.
+    
+    Returns:
+        The new pattern, or None if a referenced family/user doesn't exist
+    """
+    stmt = build_guarded_insert(
+        RecurringPatternModel,
+        _build_pattern_row(pattern_data, created_by_user_id, utcnow()),
+        family_exists_clause(pattern_data.family_id),
+        user_exists_clause(pattern_data.default_assignee_user_id),
+        user_exists_clause(created_by_user_id),
+    ).returning(RecurringPatternModel).options(
+        selectinload(RecurringPatternModel.default_assignee),
+        selectinload(RecurringPatternModel.created_by)
     )
     
-    db.add(pattern)
-    await db.flush()
-    await db.refresh(pattern)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def create_recurring_patterns(
+    db: AsyncSession,
+    patterns_data: List[RecurringPatternCreate]
+) -> List[RecurringPatternModel]:
+    """
+    Create several recurring patterns with one multi-row INSERT ... RETURNING.
     
-    # Load relationships
-    await db.refresh(pattern, ["default_assignee", "created_by"])
-    return pattern
+    Unlike create_recurring_pattern the references aren't checked inside the
+    statement: a missing family/user raises IntegrityError from its FK and
+    nothing is inserted.
+    
+    Returns:
+        The new patterns (relationships loaded), in request order
+    """
+    now = utcnow()
+    result = await db.execute(
+        insert(RecurringPatternModel)
+        .returning(RecurringPatternModel, sort_by_parameter_order=True)
+        .options(
+            selectinload(RecurringPatternModel.default_assignee),
+            selectinload(RecurringPatternModel.created_by)
+        ),
+        [_build_pattern_row(data, data.created_by_user_id, now) for data in patterns_data]
+    )
+    return list(result.scalars().all())
+
+
+def _build_pattern_row(
+    pattern_data: RecurringPatternCreate,
+    created_by_user_id: Optional[int],
+    now: datetime
+) -> dict:
+    """Build the column values for a new recurring pattern"""
+    return {
+        "family_id": pattern_data.family_id,
+        "title": pattern_data.title,
+        "description": pattern_data.description,
+        "frequency": pattern_data.frequency,
+        "interval": pattern_data.interval,
+        "by_day": pattern_data.by_day,
+        "start_time_hour": pattern_data.start_time_hour,
+        "start_time_minute": pattern_data.start_time_minute,
+        "duration_minutes": pattern_data.duration_minutes,
+        # Remove timezone info if present
+        "start_date": pattern_data.start_date.replace(tzinfo=None) if pattern_data.start_date else None,
+        "end_date": pattern_data.end_date.replace(tzinfo=None) if pattern_data.end_date else None,
+        "default_assignee_user_id": pattern_data.default_assignee_user_id,
+        "created_by_user_id": created_by_user_id,
+        "is_active": pattern_data.is_active,
+        "meta": pattern_data.meta or {},
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+# Pattern fields that carry over to future task instances, and their key in `changes`
+_PATTERN_TO_TASK_FIELDS = {
+    'title': 'title',
+    'description': 'description',
+    'start_time_hour': 'start_time_hour',
+    'start_time_minute': 'start_time_minute',
+    'duration_minutes': 'duration_minutes',
+    'default_assignee_user_id': 'assignee_user_id',
+    'meta': 'meta',
+}
 
 
 async def update_recurring_pattern(
@@ -106,58 +257,62 @@ async def update_recurring_pattern(
     Returns:
         Updated pattern or None if not found
     """
-    pattern = await get_recurring_pattern_by_id(db, pattern_id)
+    # Only the fields the client sent (and that aren't null) go into the SET clause
+    values = pattern_data.model_dump(exclude_unset=True, exclude_none=True)
+    for field in ('start_date', 'end_date'):
+        if field in values:
+            values[field] = values[field].replace(tzinfo=None)
+    
+    # The subset that carries over to future tasks
+    changes = {
+        _PATTERN_TO_TASK_FIELDS[field]: value
+        for field, value in values.items()
+        if field in _PATTERN_TO_TASK_FIELDS
+    }
+    
+    if not values:
+        return await get_recurring_pattern_by_id(db, pattern_id)
+    
+    pattern = await _update_recurring_pattern_row(db, pattern_id, values)
     if not pattern:
         return None
     
-    # Track what changed for updating tasks
-    changes = {}
-    
-    if pattern_data.title is not None:
-        changes['title'] = pattern_data.title
-        pattern.title = pattern_data.title
-    if pattern_data.description is not None:
-        changes['description'] = pattern_data.description
-        pattern.description = pattern_data.description
-    if pattern_data.frequency is not None:
-        pattern.frequency = pattern_data.frequency
-    if pattern_data.interval is not None:
-        pattern.interval = pattern_data.interval
-    if pattern_data.by_day is not None:
-        pattern.by_day = pattern_data.by_day
-    if pattern_data.start_time_hour is not None:
-        changes['start_time_hour'] = pattern_data.start_time_hour
-        pattern.start_time_hour = pattern_data.start_time_hour
-    if pattern_data.start_time_minute is not None:
-        changes['start_time_minute'] = pattern_data.start_time_minute
-        pattern.start_time_minute = pattern_data.start_time_minute
-    if pattern_data.duration_minutes is not None:
-        changes['duration_minutes'] = pattern_data.duration_minutes
-        pattern.duration_minutes = pattern_data.duration_minutes
-    if pattern_data.start_date is not None:
-        pattern.start_date = pattern_data.start_date.replace(tzinfo=None)
-    if pattern_data.end_date is not None:
-        pattern.end_date = pattern_data.end_date.replace(tzinfo=None) if pattern_data.end_date else None
-    if pattern_data.default_assignee_user_id is not None:
-        changes['assignee_user_id'] = pattern_data.default_assignee_user_id
-        pattern.default_assignee_user_id = pattern_data.default_assignee_user_id
-    if pattern_data.is_active is not None:
-        pattern.is_active = pattern_data.is_active
-    if pattern_data.meta is not None:
-        changes['meta'] = pattern_data.meta
-        pattern.meta = pattern_data.meta
-    
-    await db.flush()
-    
     # Update future tasks if requested
     if update_future_tasks and changes:
         await _update_future_task_instances(db, pattern, changes)
     
-    await db.refresh(pattern)
-    await db.refresh(pattern, ["default_assignee", "created_by"])
     return pattern
 
 
+async def set_recurring_pattern_active(
+    db: AsyncSession,
+    pattern_id: int,
+    is_active: bool
+) -> Optional[RecurringPatternModel]:
+    """Activate or deactivate a pattern; returns it with relationships, or None if not found"""
+    return await _update_recurring_pattern_row(db, pattern_id, {'is_active': is_active})
+
+
+async def _update_recurring_pattern_row(
+    db: AsyncSession,
+    pattern_id: int,
+    values: dict
+) -> Optional[RecurringPatternModel]:
+    """UPDATE ... RETURNING a pattern, so no re-select/refresh is needed afterwards"""
+    result = await db.execute(
+        update(RecurringPatternModel)
+        .where(RecurringPatternModel.id == pattern_id)
+        .values(**values)
+        .returning(RecurringPatternModel)
+        .options(
+            selectinload(RecurringPatternModel.default_assignee),
+            selectinload(RecurringPatternModel.created_by)
+        )
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
 async def _update_future_task_instances(
     db: AsyncSession,
     pattern: RecurringPatternModel,
@@ -239,18 +394,19 @@ async def delete_recurring_pattern(
         return False
     
     if delete_future_tasks:
-        # Delete all future tasks (not completed) for this pattern
-        future_tasks = await db.execute(
-            select(TaskModel).where(
+        # Delete all future tasks (not completed) for this pattern in one statement
+        await db.execute(
+            delete(TaskModel)
+            .where(
                 and_(
                     TaskModel.recurring_pattern_id == pattern_id,
                     TaskModel.status.in_([TaskStatus.todo, TaskStatus.in_progress]),
-                    TaskModel.due_at >= datetime.utcnow()
+                    # DB clock, in UTC like the naive due_at column
+                    TaskModel.due_at >= func.timezone('UTC', func.now())
                 )
             )
+            .execution_options(synchronize_session=False)
         )
-        for task in future_tasks.scalars().all():
-            await db.delete(task)
     
     await db.delete(pattern)
     await db.flush()
@@ -341,16 +497,16 @@ def _get_next_occurrence_date(
 async def generate_task_instances(
     db: AsyncSession,
     pattern_id: int,
-    generate_until: datetime,
+    days_ahead: int,
     max_instances: int = 100
 ) -> List[TaskModel]:
     """
-    Generate task instances for a recurring pattern up to a certain date.
+    Generate task instances for a recurring pattern for the next N days.
     
     Args:
         db: Database session
         pattern_id: The recurring pattern ID
-        generate_until: Generate tasks up to this date
+        days_ahead: Generate tasks up to this many days from now (UTC)
         max_instances: Maximum number of instances to generate in one call
     
     Returns:
@@ -360,53 +516,42 @@ async def generate_task_instances(
     if not pattern or not pattern.is_active:
         return []
     
-    # Determine start point
-    if pattern.last_generated_until:
-        start_from = pattern.last_generated_until
-    else:
-        start_from = pattern.start_date
+    window = _generation_window(pattern, utcnow() + timedelta(days=days_ahead))
+    if window is None:
+        return []
+    from_date, until_date, _ = window
     
-    # Don't generate beyond end_date if set
-    if pattern.end_date and generate_until > pattern.end_date:
-        generate_until = pattern.end_date
+    # Load already generated occurrence dates in one query instead of one per date
+    existing = await db.execute(
+        select(TaskModel.occurrence_date).where(
+            and_(
+                TaskModel.recurring_pattern_id == pattern_id,
+                TaskModel.occurrence_date >= from_date,
+                TaskModel.occurrence_date <= until_date
+            )
+        )
+    )
+    existing_dates = set(existing.scalars().all())
     
-    if start_from >= generate_until:
-        return []
+    rows, generate_until = _plan_task_instance_rows(pattern, window, existing_dates, max_instances)
     
-    # Generate occurrences
+    # Insert all new instances with a single multi-row INSERT ... RETURNING.
+    # A concurrent run (background prefill vs. the generate endpoint) may have
+    # inserted some of the same dates since we looked; uq_tasks_pattern_occurrence
+    # turns those into no-ops instead of duplicates.
     created_tasks = []
-    current_date = start_from.date() if isinstance(start_from, datetime) else start_from
-    generate_until_date = generate_until.date() if isinstance(generate_until, datetime) else generate_until
-    
-    count = 0
-    while current_date <= generate_until_date and count < max_instances:
-        # Check if this date should have an occurrence
-        should_generate = _should_generate_on_date(
-            current_date, 
-            pattern.start_date.date(),
-            pattern.frequency,
-            pattern.interval,
-            pattern.by_day
+    if rows:
+        result = await db.execute(
+            pg_insert(TaskModel)
+            .on_conflict_do_nothing(index_elements=["recurring_pattern_id", "occurrence_date"])
+            .returning(TaskModel)
+            .options(
+                selectinload(TaskModel.assignee),
+                selectinload(TaskModel.created_by)
+            ),
+            rows
         )
-        
-        if should_generate:
-            # Check if task already exists for this date
-            existing = await db.execute(
-                select(TaskModel).where(
-                    and_(
-                        TaskModel.recurring_pattern_id == pattern_id,
-                        TaskModel.occurrence_date == current_date
-                    )
-                )
-            )
-            if not existing.scalar_one_or_none():
-                # Create task instance
-                task = await _create_task_instance(db, pattern, current_date)
-                created_tasks.append(task)
-                count += 1
-        
-        # Move to next day to check
-        current_date += timedelta(days=1)
+        created_tasks = sorted(result.scalars().all(), key=lambda task: task.occurrence_date)
     
     # Update last_generated_until
     pattern.last_generated_until = generate_until
@@ -415,65 +560,240 @@ async def generate_task_instances(
     return created_tasks
 
 
-def _should_generate_on_date(
-    check_date: date,
+async def generate_all_due_instances(
+    db: AsyncSession,
+    days_ahead: int,
+    max_instances: int = 100,
+    pattern_ids: Optional[List[int]] = None
+) -> int:
+    """
+    Generate task instances for every active pattern in one pass.
+    
+    Meant for a periodic job: one SELECT for the patterns that are behind, one
+    for the dates they already have, then a single bulk INSERT and a single
+    bulk UPDATE of last_generated_until, however many patterns are due.
+    
+    Args:
+        db: Database session
+        days_ahead: Generate tasks up to this many days from now (UTC)
+        max_instances: Maximum number of instances to generate per pattern
+        pattern_ids: Only consider these patterns (all active ones if None)
+    
+    Returns:
+        Number of task instances created
+    """
+    generate_until = utcnow() + timedelta(days=days_ahead)
+    conditions = [
+        RecurringPatternModel.is_active.is_(True),
+        or_(
+            RecurringPatternModel.last_generated_until.is_(None),
+            RecurringPatternModel.last_generated_until < generate_until
+        )
+    ]
+    if pattern_ids is not None:
+        conditions.append(RecurringPatternModel.id.in_(pattern_ids))
+    
+    result = await db.execute(
+        select(RecurringPatternModel)
+        .where(and_(*conditions))
+        .options(raiseload("*"))
+    )
+    windows = {}
+    for pattern in result.scalars():
+        window = _generation_window(pattern, generate_until)
+        if window is not None:
+            windows[pattern.id] = (pattern, window)
+    
+    if not windows:
+        return 0
+    
+    existing = await db.execute(
+        select(TaskModel.recurring_pattern_id, TaskModel.occurrence_date).where(
+            and_(
+                TaskModel.recurring_pattern_id.in_(windows),
+                TaskModel.occurrence_date >= min(window[0] for _, window in windows.values()),
+                TaskModel.occurrence_date <= max(window[1] for _, window in windows.values())
+            )
+        )
+    )
+    existing_dates = defaultdict(set)
+    for pattern_id, occurrence_date in existing:
+        existing_dates[pattern_id].add(occurrence_date)
+    
+    rows = []
+    generated_until = {}
+    for pattern, window in windows.values():
+        pattern_rows, generated_until[pattern.id] = _plan_task_instance_rows(
+            pattern, window, existing_dates[pattern.id], max_instances
+        )
+        rows.extend(pattern_rows)
+    
+    created = 0
+    if rows:
+        result = await db.execute(
+            pg_insert(TaskModel)
+            .on_conflict_do_nothing(index_elements=["recurring_pattern_id", "occurrence_date"])
+            .returning(TaskModel.id),
+            rows
+        )
+        created = len(result.all())
+    
+    # Bulk UPDATE by primary key (executemany)
+    await db.execute(
+        update(RecurringPatternModel),
+        [
+            {"id": pattern_id, "last_generated_until": until}
+            for pattern_id, until in generated_until.items()
+        ]
+    )
+    
+    # The bulk UPDATE bypasses the identity map; keep patterns already loaded
+    # in this session (e.g. just created) in step without dirtying them
+    for pattern, _ in windows.values():
+        set_committed_value(pattern, "last_generated_until", generated_until[pattern.id])
+    return created
+
+
+async def generate_task_instances_in_background(pattern_id: int, days_ahead: int) -> None:
+    """
+    Generate task instances on a session of its own, outside any request.
+    
+    Meant for FastAPI BackgroundTasks, so the create/activate response doesn't
+    wait on the prefill. The caller must commit the pattern first. Failures are
+    logged rather than raised - the generate endpoint can always backfill.
+    """
+    try:
+        async with async_session_factory() as db:
+            await generate_task_instances(db, pattern_id, days_ahead)
+            await db.commit()
+    except Exception:
+        log.exception("Background task generation failed for pattern %s", pattern_id)
+
+
+def _generation_window(
+    pattern: RecurringPatternModel,
+    generate_until: datetime
+) -> Optional[Tuple[date, date, datetime]]:
+    """
+    Dates a pattern still needs instances for, up to generate_until (capped at end_date).
+    
+    Returns (first date, last date, new last_generated_until), or None if the
+    pattern is already generated that far.
+    """
+    if pattern.end_date and generate_until > pattern.end_date:
+        generate_until = pattern.end_date
+    
+    start_from = pattern.last_generated_until or pattern.start_date
+    if start_from >= generate_until:
+        return None
+    
+    return start_from.date(), generate_until.date(), generate_until
+
+
+def _plan_task_instance_rows(
+    pattern: RecurringPatternModel,
+    window: Tuple[date, date, datetime],
+    existing_dates: set[date],
+    max_instances: int
+) -> Tuple[List[dict], datetime]:
+    """
+    Rows for the pattern's occurrences in the window that don't exist yet (no DB access).
+    
+    Returns the rows and the new last_generated_until. If max_instances cuts the
+    window short, that stops at the last planned date, so the next run picks up
+    the rest instead of skipping it.
+    """
+    from_date, until_date, generate_until = window
+    rows = []
+    occurrences = _iter_occurrence_dates(
+        from_date,
+        until_date,
+        pattern.start_date.date(),
+        pattern.frequency,
+        pattern.interval,
+        pattern.by_day
+    )
+    for occurrence_date in occurrences:
+        if occurrence_date in existing_dates:
+            continue
+        rows.append(_build_task_instance_row(pattern, occurrence_date))
+        if len(rows) >= max_instances:
+            return rows, datetime.combine(occurrence_date, time.min)
+    return rows, generate_until
+
+
+def _iter_occurrence_dates(
+    from_date: date,
+    until_date: date,
     start_date: date,
     frequency: RecurrenceFrequency,
     interval: int,
     by_day: Optional[list[int]]
-) -> bool:
-    """Check if a task should be generated on a specific date"""
-    if check_date < start_date:
-        return False
+) -> Iterator[date]:
+    """
+    Yield the pattern's occurrence dates between from_date and until_date, in order.
     
-    if frequency == RecurrenceFrequency.daily:
-        days_diff = (check_date - start_date).days
-        return days_diff % interval == 0
+    Jumps straight from one active period (every `interval` days/weeks/months/
+    years counted from start_date) to the next instead of testing each calendar
+    day, so a monthly pattern over two years takes ~24 steps rather than ~730.
+    """
+    from_date = max(from_date, start_date)
+    if from_date > until_date:
+        return
+    
+    if frequency == RecurrenceFrequency.daily or (frequency == RecurrenceFrequency.weekly and not by_day):
+        # Every N days, or every N weeks on the start date's weekday
+        step = interval if frequency == RecurrenceFrequency.daily else interval * 7
+        offset = -(-(from_date - start_date).days // step) * step
+        current = start_date + timedelta(days=offset)
+        while current <= until_date:
+            yield current
+            current += timedelta(days=step)
     
     elif frequency == RecurrenceFrequency.weekly:
-        if not by_day:
-            # Weekly on same day
-            days_diff = (check_date - start_date).days
-            return days_diff % (interval * 7) == 0
-        
-        # Check if this day of week is in by_day
-        weekday = check_date.weekday()
-        if weekday not in by_day:
-            return False
-        
-        # Check if we're in the right week interval
-        weeks_diff = (check_date - start_date).days // 7
-        return weeks_diff % interval == 0
-    
-    elif frequency == RecurrenceFrequency.monthly:
-        if not by_day:
-            # Monthly on same day of month
-            months_diff = (check_date.year - start_date.year) * 12 + (check_date.month - start_date.month)
-            return months_diff % interval == 0 and check_date.day == start_date.day
-        
-        # Check if this day of month is in by_day
-        if check_date.day not in by_day:
-            return False
-        
-        # Check if we're in the right month interval
-        months_diff = (check_date.year - start_date.year) * 12 + (check_date.month - start_date.month)
-        return months_diff % interval == 0
-    
-    elif frequency == RecurrenceFrequency.yearly:
-        years_diff = check_date.year - start_date.year
-        return (years_diff % interval == 0 and 
-                check_date.month == start_date.month and 
-                check_date.day == start_date.day)
-    
-    return False
+        # Chosen weekdays within every Nth 7-day block counted from start_date
+        weekdays = set(by_day)
+        weeks = (from_date - start_date).days // 7
+        weeks -= weeks % interval
+        while True:
+            block_start = start_date + timedelta(weeks=weeks)
+            if block_start > until_date:
+                return
+            for offset in range(7):
+                current = block_start + timedelta(days=offset)
+                if from_date <= current <= until_date and current.weekday() in weekdays:
+                    yield current
+            weeks += interval
+    
+    elif frequency in (RecurrenceFrequency.monthly, RecurrenceFrequency.yearly):
+        # Given days of every Nth month (yearly: the start date's day, every 12*N months);
+        # days a month doesn't have (e.g. the 31st in April) are skipped
+        if frequency == RecurrenceFrequency.yearly:
+            step, days = interval * 12, [start_date.day]
+        else:
+            step, days = interval, sorted(set(by_day)) if by_day else [start_date.day]
+        first_of_start_month = start_date.replace(day=1)
+        months = (from_date.year - start_date.year) * 12 + (from_date.month - start_date.month)
+        months -= months % step
+        while True:
+            month_start = first_of_start_month + relativedelta(months=months)
+            if month_start > until_date:
+                return
+            for day in days:
+                try:
+                    current = month_start.replace(day=day)
+                except ValueError:
+                    continue
+                if from_date <= current <= until_date:
+                    yield current
+            months += step
 
 
-async def _create_task_instance(
-    db: AsyncSession,
+def _build_task_instance_row(
     pattern: RecurringPatternModel,
     occurrence_date: date
-) -> TaskModel:
-    """Create a single task instance from a recurring pattern"""
+) -> dict:
+    """Build the column values for a single task instance of a recurring pattern"""
     # Calculate due datetime
     due_datetime = None
     if pattern.start_time_hour is not None:
@@ -485,46 +805,87 @@ async def _create_task_instance(
             )
         )
     
-    task = TaskModel(
-        family_id=pattern.family_id,
-        recurring_pattern_id=pattern.id,
-        occurrence_date=occurrence_date,
-        title=pattern.title,
-        description=pattern.description,
-        assignee_user_id=pattern.default_assignee_user_id,
-        created_by_user_id=pattern.created_by_user_id,
-        status=TaskStatus.todo,
-        due_at=due_datetime,
-        meta={
+    return {
+        "family_id": pattern.family_id,
+        "recurring_pattern_id": pattern.id,
+        "occurrence_date": occurrence_date,
+        "title": pattern.title,
+        "description": pattern.description,
+        "assignee_user_id": pattern.default_assignee_user_id,
+        "created_by_user_id": pattern.created_by_user_id,
+        "status": TaskStatus.todo,
+        "due_at": due_datetime,
+        "meta": {
             **pattern.meta,
             "generated_from_pattern": True,
             "duration_minutes": pattern.duration_minutes
-        }
-    )
-    
-    db.add(task)
-    await db.flush()
-    await db.refresh(task)
-    return task
+        },
+    }
 
 
-async def get_tasks_for_pattern(
+async def stream_tasks_for_pattern(
     db: AsyncSession,
     pattern_id: int,
-    include_completed: bool = False
-) -> List[TaskModel]:
-    """Get all task instances for a recurring pattern"""
+    include_completed: bool = False,
+    batch_size: int = 100
+) -> AsyncIterator[TaskModel]:
+    """
+    Stream all task instances for a recurring pattern, ordered by occurrence date.
+    
+    Rows come off a server-side cursor batch_size at a time (relationships are
+    selectin-loaded per batch), so long-running patterns are never fully
+    materialized in memory.
+    """
     query = select(TaskModel).where(
-        TaskModel.recurring_pattern_id == pattern_id
+        *_pattern_task_filters(pattern_id, include_completed)
     ).options(
         selectinload(TaskModel.assignee),
-        selectinload(TaskModel.created_by)
-    )
+        selectinload(TaskModel.created_by),
+        raiseload("*", sql_only=True)
+    ).order_by(TaskModel.occurrence_date, TaskModel.id).execution_options(yield_per=batch_size)
     
-    if not include_completed:
-        query = query.where(TaskModel.status != TaskStatus.done)
+    result = await db.stream_scalars(query)
+    async for task in result:
+        yield task
+
+
+async def get_pattern_tasks_version(
+    db: AsyncSession,
+    pattern_id: int,
+    include_completed: bool = False
+) -> Tuple[int, int, Optional[datetime]]:
+    """
+    Version of a stream_tasks_for_pattern() result without loading it, for ETags.
     
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    Returns (task count, linked creator/assignee count, newest updated_at
+    across the tasks and those users), like get_tasks_list_version.
+    """
+    creator = aliased(UserModel)
+    assignee = aliased(UserModel)
+    result = await db.execute(
+        select(
+            func.count(TaskModel.id),
+            func.count(creator.id) + func.count(assignee.id),
+            func.greatest(
+                func.max(TaskModel.updated_at),
+                func.max(creator.updated_at),
+                func.max(assignee.updated_at)
+            )
+        )
+        .select_from(TaskModel)
+        .outerjoin(creator, TaskModel.created_by_user_id == creator.id)
+        .outerjoin(assignee, TaskModel.assignee_user_id == assignee.id)
+        .where(*_pattern_task_filters(pattern_id, include_completed))
+    )
+    return tuple(result.one())
 
 
+def _pattern_task_filters(pattern_id: int, include_completed: bool) -> list:
+    """WHERE clauses shared by stream_tasks_for_pattern and get_pattern_tasks_version"""
+    filters = [TaskModel.recurring_pattern_id == pattern_id]
+    if not include_completed:
+        # Same predicate as the ix_tasks_pattern_active partial index. Inlined
+        # rather than bound: under a generic plan for the prepared statement
+        # the planner can't prove a parameter matches the index predicate
+        filters.append(TaskModel.status != literal_column("'done'"))
+    return filters
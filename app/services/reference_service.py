@@ -0,0 +1,88 @@
+from typing import Any, Iterable, Optional, Set, Tuple
+from sqlalchemy import select, literal, true, union_all, ColumnElement
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.family import Family as FamilyModel
+from app.models.user import User as UserModel
+
+
+async def validate_references(
+    db: AsyncSession,
+    family_id: Optional[int] = None,
+    user_ids: Iterable[Optional[int]] = ()
+) -> Set[Tuple[str, int]]:
+    """
+    Check which of the referenced families/users exist in a single round-trip.
+
+    Args:
+        db: Database session
+        family_id: Family ID to check (skipped if None)
+        user_ids: User IDs to check (None entries are ignored)
+
+    Returns:
+        Set of ("family", id) / ("user", id) pairs that exist
+    """
+    user_ids = {uid for uid in user_ids if uid is not None}
+
+    queries = []
+    if family_id is not None:
+        queries.append(
+            select(FamilyModel.id, literal("family").label("kind"))
+            .where(FamilyModel.id == family_id)
+        )
+    if user_ids:
+        queries.append(
+            select(UserModel.id, literal("user").label("kind"))
+            .where(UserModel.id.in_(user_ids))
+        )
+
+    if not queries:
+        return set()
+
+    query = queries[0] if len(queries) == 1 else union_all(*queries)
+    result = await db.execute(query)
+    return {(kind, ref_id) for ref_id, kind in result.all()}
+
+
+def family_exists_clause(family_id: int) -> ColumnElement[bool]:
+    """EXISTS clause that holds when the family exists"""
+    return select(FamilyModel.id).where(FamilyModel.id == family_id).exists()
+
+
+def user_exists_clause(user_id: Optional[int]) -> ColumnElement[bool]:
+    """EXISTS clause that holds when the user exists (or no user is referenced)"""
+    if user_id is None:
+        return true()
+    return select(UserModel.id).where(UserModel.id == user_id).exists()
+
+
+def build_guarded_insert(model: Any, values: dict, *conditions: ColumnElement[bool]) -> Insert:
+    """
+    Build an INSERT ... SELECT that only inserts the row when all conditions hold.
+
+    Lets a write and its reference checks share one statement (and one
+    round-trip). Chain `.returning(model)` to get the row back; no row means
+    a condition failed.
+    """
+    columns = model.__table__.c
+    source = select(
+        *[literal(value, type_=columns[name].type) for name, value in values.items()]
+    ).where(*conditions)
+    return insert(model).from_select(list(values), source)
+
+
+def violated_constraint(exc: IntegrityError) -> Optional[str]:
+    """
+    Name of the constraint behind an IntegrityError, if the driver reports it.
+    
+    Lets a route map an FK/unique violation from a plain INSERT straight to a
+    404/400 instead of checking references up front.
+    """
+    # asyncpg puts it on the driver exception the DBAPI adapter wraps
+    for error in (exc.orig, getattr(exc.orig, "__cause__", None)):
+        name = getattr(error, "constraint_name", None)
+        if name:
+            return name
+    return None
@@ -1,21 +1,73 @@
-from typing import List, Optional
-from sqlalchemy import select, and_
+from typing import AsyncIterator, List, Optional, Tuple
+from sqlalchemy import select, and_, bindparam, insert, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 from datetime import datetime
 
 from app.models.reminder import Reminder as ReminderModel
+from app.models.user import User as UserModel
 from app.api.schemas import ReminderCreate, ReminderUpdate
+from app.core.clock import utcnow
 
-async def get_reminders(
+# Hot lookup is built once; each call only binds :reminder_id
+_get_reminder_by_id_stmt = (
+    select(ReminderModel)
+    .where(ReminderModel.id == bindparam("reminder_id"))
+    .options(joinedload(ReminderModel.user))
+)
+
+async def stream_reminders(
+    db: AsyncSession,
+    task_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    sent: Optional[bool] = None,
+    batch_size: int = 100
+) -> AsyncIterator[ReminderModel]:
+    """Stream reminders with optional filters, batch_size rows at a time"""
+    query = select(ReminderModel).options(
+        selectinload(ReminderModel.user),
+        raiseload("*", sql_only=True)
+    ).execution_options(yield_per=batch_size)
+    
+    filters = _reminder_filters(task_id, user_id, sent)
+    if filters:
+        query = query.where(and_(*filters))
+    
+    result = await db.stream_scalars(query)
+    async for reminder in result:
+        yield reminder
+
+async def get_reminders_list_version(
     db: AsyncSession,
     task_id: Optional[int] = None,
     user_id: Optional[int] = None,
     sent: Optional[bool] = None
-) -> List[ReminderModel]:
-    """Get reminders with optional filters"""
-    query = select(ReminderModel).options(selectinload(ReminderModel.user))
+) -> Tuple[int, int, Optional[datetime]]:
+    """
+    Version of a stream_reminders() result without loading it, for ETags.
     
+    Returns (reminder count, linked user count, newest updated_at across the
+    reminders and their users).
+    """
+    query = (
+        select(
+            func.count(ReminderModel.id),
+            func.count(UserModel.id),
+            func.greatest(func.max(ReminderModel.updated_at), func.max(UserModel.updated_at))
+        )
+        .select_from(ReminderModel)
+        .outerjoin(UserModel, ReminderModel.user_id == UserModel.id)
+    )
+    
+    filters = _reminder_filters(task_id, user_id, sent)
+    if filters:
+        query = query.where(and_(*filters))
+    
+    result = await db.execute(query)
+    return tuple(result.one())
+
+def _reminder_filters(task_id: Optional[int], user_id: Optional[int], sent: Optional[bool]) -> list:
+    """WHERE clauses shared by get_reminders and get_reminders_list_version"""
     filters = []
     if task_id is not None:
         filters.append(ReminderModel.task_id == task_id)
@@ -26,20 +78,11 @@ async def get_reminders(
             filters.append(ReminderModel.sent_at.isnot(None))
         else:
             filters.append(ReminderModel.sent_at.is_(None))
-    
-    if filters:
-        query = query.where(and_(*filters))
-    
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    return filters
 
 async def get_reminder_by_id(db: AsyncSession, reminder_id: int) -> Optional[ReminderModel]:
-    """Get a reminder by ID"""
-    result = await db.execute(
-        select(ReminderModel)
-        .where(ReminderModel.id == reminder_id)
-        .options(selectinload(ReminderModel.user))
-    )
+    """Get a reminder by ID (user joined in, one round-trip)"""
+    result = await db.execute(_get_reminder_by_id_stmt, {"reminder_id": reminder_id})
     return result.scalar_one_or_none()
 
 async def create_reminder(
@@ -47,45 +90,50 @@ async def create_reminder(
     task_id: int,
     reminder_data: ReminderCreate
 ) -> ReminderModel:
-    """Create a new reminder for a task"""
+    """
+    Create a new reminder for a task with a single INSERT ... RETURNING.
+    
+    A missing task/user raises IntegrityError from the FK instead of being
+    pre-checked.
+    """
     # Remove timezone info if present (make naive)
     due_at = reminder_data.due_at.replace(tzinfo=None) if reminder_data.due_at else None
     
-    reminder = ReminderModel(
-        task_id=task_id,
-        user_id=reminder_data.user_id,
-        due_at=due_at,
-        payload=reminder_data.payload or {},
+    result = await db.execute(
+        insert(ReminderModel)
+        .values(
+            task_id=task_id,
+            user_id=reminder_data.user_id,
+            due_at=due_at,
+            payload=reminder_data.payload or {},
+        )
+        .returning(ReminderModel)
+        .options(selectinload(ReminderModel.user))
     )
-    db.add(reminder)
-    await db.flush()
-    await db.refresh(reminder)
-    
-    # Load user relationship
-    await db.refresh(reminder, ["user"])
-    return reminder
+    return result.scalar_one()
 
 async def update_reminder(
     db: AsyncSession,
     reminder_id: int,
     reminder_data: ReminderUpdate
 ) -> Optional[ReminderModel]:
-    """Update an existing reminder"""
-    reminder = await get_reminder_by_id(db, reminder_id)
-    if not reminder:
-        return None
+    """Update an existing reminder with only the fields that were sent"""
+    values = reminder_data.model_dump(exclude_unset=True, exclude_none=True)
+    if not values:
+        return await get_reminder_by_id(db, reminder_id)
     
-    if reminder_data.due_at is not None:
-        reminder.due_at = reminder_data.due_at.replace(tzinfo=None) if reminder_data.due_at else None
-    if reminder_data.sent_at is not None:
-        reminder.sent_at = reminder_data.sent_at
-    if reminder_data.payload is not None:
-        reminder.payload = reminder_data.payload
+    if 'due_at' in values:
+        values['due_at'] = values['due_at'].replace(tzinfo=None)
     
-    await db.flush()
-    await db.refresh(reminder)
-    await db.refresh(reminder, ["user"])
-    return reminder
+    result = await db.execute(
+        update(ReminderModel)
+        .where(ReminderModel.id == reminder_id)
+        .values(**values)
+        .returning(ReminderModel)
+        .options(selectinload(ReminderModel.user))
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
 
 async def delete_reminder(db: AsyncSession, reminder_id: int) -> bool:
     """Delete a reminder"""
@@ -98,29 +146,30 @@ async def delete_reminder(db: AsyncSession, reminder_id: int) -> bool:
     return True
 
 async def mark_reminder_sent(db: AsyncSession, reminder_id: int) -> Optional[ReminderModel]:
-    """Mark a reminder as sent"""
-    reminder = await get_reminder_by_id(db, reminder_id)
-    if not reminder:
-        return None
-    
-    reminder.sent_at = datetime.utcnow()
-    
-    await db.flush()
-    await db.refresh(reminder)
-    await db.refresh(reminder, ["user"])
-    return reminder
+    """Mark a reminder as sent (UPDATE ... RETURNING, no refresh needed)"""
+    result = await db.execute(
+        update(ReminderModel)
+        .where(ReminderModel.id == reminder_id)
+        .values(sent_at=utcnow())
+        .returning(ReminderModel)
+        .options(selectinload(ReminderModel.user))
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
 
 async def get_due_reminders(db: AsyncSession, limit: int = 100) -> List[ReminderModel]:
-    """Get reminders that are due and haven't been sent yet"""
+    """Get reminders that are due and haven't been sent yet, most overdue first"""
     result = await db.execute(
         select(ReminderModel)
         .where(
             and_(
-                ReminderModel.due_at <= datetime.utcnow(),
+                ReminderModel.due_at <= utcnow(),
                 ReminderModel.sent_at.is_(None)
             )
         )
         .options(selectinload(ReminderModel.user))
+        # Walks ix_reminders_due_pending in order and stops at the limit
+        .order_by(ReminderModel.due_at)
         .limit(limit)
     )
     return list(result.scalars().all())
@@ -1,25 +1,96 @@
-from typing import List, Optional
-from sqlalchemy import select, and_
+from typing import AsyncIterator, List, Optional, Tuple
+from sqlalchemy import select, and_, bindparam, exists, insert, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, joinedload, raiseload, selectinload
 from datetime import datetime
 
 from app.models.task import Task as TaskModel
+from app.models.user import User as UserModel
 from app.models.enums import TaskStatus
 from app.api.schemas import TaskCreate, TaskUpdate
+from app.core.clock import utcnow
 
-async def get_tasks(
+# Hot lookups are built once; each call only binds :task_id
+_get_task_by_id_stmt = (
+    select(TaskModel)
+    .where(TaskModel.id == bindparam("task_id"))
+    .options(
+        joinedload(TaskModel.created_by),
+        joinedload(TaskModel.assignee)
+    )
+)
+_task_exists_stmt = select(exists().where(TaskModel.id == bindparam("task_id")))
+
+async def stream_tasks(
     db: AsyncSession,
     family_id: Optional[int] = None,
     status: Optional[TaskStatus] = None,
-    assignee_user_id: Optional[int] = None
-) -> List[TaskModel]:
-    """Get tasks with optional filters"""
+    assignee_user_id: Optional[int] = None,
+    batch_size: int = 100
+) -> AsyncIterator[TaskModel]:
+    """
+    Stream tasks with optional filters.
+    
+    Rows come off a server-side cursor batch_size at a time (relationships are
+    selectin-loaded per batch), so the full list is never materialized.
+    """
     query = select(TaskModel).options(
         selectinload(TaskModel.created_by),
-        selectinload(TaskModel.assignee)
+        selectinload(TaskModel.assignee),
+        raiseload("*", sql_only=True)
+    ).execution_options(yield_per=batch_size)
+    
+    filters = _task_filters(family_id, status, assignee_user_id)
+    if filters:
+        query = query.where(and_(*filters))
+    
+    result = await db.stream_scalars(query)
+    async for task in result:
+        yield task
+
+async def get_tasks_list_version(
+    db: AsyncSession,
+    family_id: Optional[int] = None,
+    status: Optional[TaskStatus] = None,
+    assignee_user_id: Optional[int] = None
+) -> Tuple[int, int, Optional[datetime]]:
+    """
+    Version of a stream_tasks() result without loading it, for ETags.
+    
+    Returns (task count, linked creator/assignee count, newest updated_at
+    across the tasks and those users). The linked count catches FK
+    SET NULLs, which don't touch the task's updated_at.
+    """
+    creator = aliased(UserModel)
+    assignee = aliased(UserModel)
+    query = (
+        select(
+            func.count(TaskModel.id),
+            func.count(creator.id) + func.count(assignee.id),
+            func.greatest(
+                func.max(TaskModel.updated_at),
+                func.max(creator.updated_at),
+                func.max(assignee.updated_at)
+            )
+        )
+        .select_from(TaskModel)
+        .outerjoin(creator, TaskModel.created_by_user_id == creator.id)
+        .outerjoin(assignee, TaskModel.assignee_user_id == assignee.id)
     )
     
+    filters = _task_filters(family_id, status, assignee_user_id)
+    if filters:
+        query = query.where(and_(*filters))
+    
+    result = await db.execute(query)
+    return tuple(result.one())
+
+def _task_filters(
+    family_id: Optional[int],
+    status: Optional[TaskStatus],
+    assignee_user_id: Optional[int]
+) -> list:
+    """WHERE clauses shared by get_tasks and get_tasks_list_version"""
     filters = []
     if family_id is not None:
         filters.append(TaskModel.family_id == family_id)
@@ -27,84 +98,84 @@ async def get_tasks(
         filters.append(TaskModel.status == status)
     if assignee_user_id is not None:
         filters.append(TaskModel.assignee_user_id == assignee_user_id)
-    
-    if filters:
-        query = query.where(and_(*filters))
-    
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    return filters
 
 async def get_task_by_id(db: AsyncSession, task_id: int) -> Optional[TaskModel]:
-    """Get a task by ID with relationships loaded"""
-    result = await db.execute(
-        select(TaskModel)
-        .where(TaskModel.id == task_id)
-        .options(
-            selectinload(TaskModel.created_by),
-            selectinload(TaskModel.assignee)
-        )
-    )
+    """Get a task by ID with relationships joined in (one round-trip)"""
+    result = await db.execute(_get_task_by_id_stmt, {"task_id": task_id})
     return result.scalar_one_or_none()
 
+async def task_exists(db: AsyncSession, task_id: int) -> bool:
+    """Check whether a task exists without loading it"""
+    return bool(await db.scalar(_task_exists_stmt, {"task_id": task_id}))
+
 async def create_task(
     db: AsyncSession,
     task_data: TaskCreate,
     created_by_user_id: Optional[int] = None
 ) -> TaskModel:
-    """Create a new task"""
+    """
+    Create a new task with a single INSERT ... RETURNING.
+    
+    Family/user references aren't pre-checked; a bad one raises IntegrityError
+    from the FK (see reference_service.violated_constraint).
+    """
     # Remove timezone info if present (make naive)
     due_at = task_data.due_at.replace(tzinfo=None) if task_data.due_at else None
     
-    task = TaskModel(
-        family_id=task_data.family_id,
-        title=task_data.title,
-        description=task_data.description,
-        created_by_user_id=created_by_user_id,
-        assignee_user_id=task_data.assignee_user_id,
-        status=task_data.status,
-        due_at=due_at,
-        meta=task_data.meta or {},
+    result = await db.execute(
+        insert(TaskModel)
+        .values(
+            family_id=task_data.family_id,
+            title=task_data.title,
+            description=task_data.description,
+            created_by_user_id=created_by_user_id,
+            assignee_user_id=task_data.assignee_user_id,
+            status=task_data.status,
+            due_at=due_at,
+            meta=task_data.meta or {},
+        )
+        .returning(TaskModel)
+        .options(
+            selectinload(TaskModel.created_by),
+            selectinload(TaskModel.assignee)
+        )
     )
-    db.add(task)
-    await db.flush()
-    await db.refresh(task)
-    
-    # Load relationships
-    await db.refresh(task, ["created_by", "assignee"])
-    return task
+    return result.scalar_one()
 
 async def update_task(
     db: AsyncSession,
     task_id: int,
     task_data: TaskUpdate
 ) -> Optional[TaskModel]:
-    """Update an existing task"""
-    task = await get_task_by_id(db, task_id)
-    if not task:
-        return None
+    """
+    Update an existing task (UPDATE ... RETURNING, no refresh needed).
     
-    if task_data.title is not None:
-        task.title = task_data.title
-    if task_data.description is not None:
-        task.description = task_data.description
-    if task_data.assignee_user_id is not None:
-        task.assignee_user_id = task_data.assignee_user_id
-    if task_data.status is not None:
-        task.status = task_data.status
-        # Auto-set completed_at when marking as done
-        if task_data.status == TaskStatus.done and not task.completed_at:
-            task.completed_at = datetime.utcnow()
-    if task_data.due_at is not None:
-        task.due_at = task_data.due_at.replace(tzinfo=None) if task_data.due_at else None
-    if task_data.completed_at is not None:
-        task.completed_at = task_data.completed_at
-    if task_data.meta is not None:
-        task.meta = task_data.meta
+    Only the fields the client sent (and that aren't null) go into the SET
+    clause, so the statement touches just the dirty columns.
+    """
+    values = task_data.model_dump(exclude_unset=True, exclude_none=True)
+    if not values:
+        return await get_task_by_id(db, task_id)
     
-    await db.flush()
-    await db.refresh(task)
-    await db.refresh(task, ["created_by", "assignee"])
-    return task
+    if 'due_at' in values:
+        values['due_at'] = values['due_at'].replace(tzinfo=None)
+    # Auto-set completed_at when marking as done, unless it's already set
+    if values.get('status') == TaskStatus.done and 'completed_at' not in values:
+        values['completed_at'] = func.coalesce(TaskModel.completed_at, utcnow())
+    
+    result = await db.execute(
+        update(TaskModel)
+        .where(TaskModel.id == task_id)
+        .values(**values)
+        .returning(TaskModel)
+        .options(
+            selectinload(TaskModel.created_by),
+            selectinload(TaskModel.assignee)
+        )
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
 
 async def delete_task(db: AsyncSession, task_id: int) -> bool:
     """Delete a task"""
@@ -117,34 +188,41 @@ async def delete_task(db: AsyncSession, task_id: int) -> bool:
     return True
 
 async def complete_task(db: AsyncSession, task_id: int) -> Optional[TaskModel]:
-    """Mark a task as completed"""
-    task = await get_task_by_id(db, task_id)
-    if not task:
-        return None
-    
-    task.status = TaskStatus.done
-    task.completed_at = datetime.utcnow()
-    
-    await db.flush()
-    await db.refresh(task)
-    await db.refresh(task, ["created_by", "assignee"])
-    return task
+    """Mark a task as completed (UPDATE ... RETURNING, no refresh needed)"""
+    result = await db.execute(
+        update(TaskModel)
+        .where(TaskModel.id == task_id)
+        .values(status=TaskStatus.done, completed_at=utcnow())
+        .returning(TaskModel)
+        .options(
+            selectinload(TaskModel.created_by),
+            selectinload(TaskModel.assignee)
+        )
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
 
-async def get_overdue_tasks(db: AsyncSession, family_id: Optional[int] = None) -> List[TaskModel]:
-    """Get tasks that are overdue"""
+async def stream_overdue_tasks(
+    db: AsyncSession,
+    family_id: Optional[int] = None,
+    batch_size: int = 100
+) -> AsyncIterator[TaskModel]:
+    """Stream tasks that are overdue, batch_size rows at a time"""
     query = select(TaskModel).where(
         and_(
-            TaskModel.due_at < datetime.utcnow(),
+            TaskModel.due_at < utcnow(),
             TaskModel.status.in_([TaskStatus.todo, TaskStatus.in_progress])
         )
     ).options(
         selectinload(TaskModel.created_by),
-        selectinload(TaskModel.assignee)
-    )
+        selectinload(TaskModel.assignee),
+        raiseload("*", sql_only=True)
+    ).execution_options(yield_per=batch_size)
     
     if family_id is not None:
         query = query.where(TaskModel.family_id == family_id)
     
-    result = await db.execute(query)
-    return list(result.scalars().all())
+    result = await db.stream_scalars(query)
+    async for task in result:
+        yield task
 
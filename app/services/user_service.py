@@ -1,19 +1,48 @@
-from typing import List, Optional
-from sqlalchemy import select
+from typing import AsyncIterator, Optional, Tuple
+from datetime import datetime
+from sqlalchemy import select, exists, bindparam, insert, update, func, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
+from app.core.config import get_settings
 from app.models.user import User as UserModel
 from app.api.schemas import UserCreate, UserUpdate
 
-async def get_users(db: AsyncSession) -> List[UserModel]:
-    """Get all users"""
-    result = await db.execute(select(UserModel))
-    return list(result.scalars().all())
+# Only positive lookups are cached, so a freshly created user is never 404'd
+_user_exists_cache = TTLCache(get_settings().existence_cache_ttl_seconds)
+
+# Hot lookup is built once; each call only binds :user_id
+_user_exists_stmt = select(exists().where(UserModel.id == bindparam("user_id")))
+
+async def stream_users(db: AsyncSession, batch_size: int = 100) -> AsyncIterator[UserModel]:
+    """Stream all users, batch_size rows at a time"""
+    result = await db.stream_scalars(select(UserModel).execution_options(yield_per=batch_size))
+    async for user in result:
+        yield user
+
+async def get_users_list_version(db: AsyncSession) -> Tuple[int, int, Optional[datetime]]:
+    """Version of the stream_users() result without loading it, for ETags"""
+    result = await db.execute(select(func.count(UserModel.id), literal(0), func.max(UserModel.updated_at)))
+    return tuple(result.one())
 
 async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[UserModel]:
-    """Get a user by ID"""
-    result = await db.execute(select(UserModel).where(UserModel.id == user_id))
-    return result.scalar_one_or_none()
+    """
+    Get a user by ID.
+    
+    Uses the session's identity map first, so repeat lookups within one
+    request (one session) don't hit the database again.
+    """
+    return await db.get(UserModel, user_id)
+
+async def user_exists(db: AsyncSession, user_id: int) -> bool:
+    """Check whether a user exists (cached for a few seconds per worker)"""
+    if _user_exists_cache.get(user_id):
+        return True
+    
+    found = bool(await db.scalar(_user_exists_stmt, {"user_id": user_id}))
+    if found:
+        _user_exists_cache.set(user_id, True)
+    return found
 
 async def get_user_by_phone(db: AsyncSession, phone_e164: str) -> Optional[UserModel]:
     """Get a user by phone number (E.164 format)"""
@@ -21,39 +50,45 @@ async def get_user_by_phone(db: AsyncSession, phone_e164: str) -> Optional[UserM
     return result.scalar_one_or_none()
 
 async def create_user(db: AsyncSession, user_data: UserCreate) -> UserModel:
-    """Create a new user"""
-    user = UserModel(
-        display_name=user_data.display_name,
-        phone_e164=user_data.phone_e164,
-        whatsapp_opt_in=user_data.whatsapp_opt_in,
-        whatsapp_verified=False,
-        preferences=user_data.preferences or {},
+    """
+    Create a new user with a single INSERT ... RETURNING.
+    
+    A duplicate phone raises IntegrityError from uq_users_phone instead of
+    being pre-checked.
+    """
+    result = await db.execute(
+        insert(UserModel)
+        .values(
+            display_name=user_data.display_name,
+            phone_e164=user_data.phone_e164,
+            whatsapp_opt_in=user_data.whatsapp_opt_in,
+            whatsapp_verified=False,
+            preferences=user_data.preferences or {},
+        )
+        .returning(UserModel)
     )
-    db.add(user)
-    await db.flush()
-    await db.refresh(user)
-    return user
+    return result.scalar_one()
 
 async def update_user(db: AsyncSession, user_id: int, user_data: UserUpdate) -> Optional[UserModel]:
-    """Update an existing user"""
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        return None
+    """
+    Update an existing user with a single UPDATE ... RETURNING.
     
-    if user_data.display_name is not None:
-        user.display_name = user_data.display_name
-    if user_data.phone_e164 is not None:
-        user.phone_e164 = user_data.phone_e164
-    if user_data.whatsapp_opt_in is not None:
-        user.whatsapp_opt_in = user_data.whatsapp_opt_in
-    if user_data.whatsapp_verified is not None:
-        user.whatsapp_verified = user_data.whatsapp_verified
-    if user_data.preferences is not None:
-        user.preferences = user_data.preferences
+    Changing to a phone that's already taken raises IntegrityError from
+    uq_users_phone instead of being pre-checked.
+    """
+    values = user_data.model_dump(exclude_unset=True, exclude_none=True)
     
-    await db.flush()
-    await db.refresh(user)
-    return user
+    if not values:
+        return await get_user_by_id(db, user_id)
+    
+    result = await db.execute(
+        update(UserModel)
+        .where(UserModel.id == user_id)
+        .values(**values)
+        .returning(UserModel)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
 
 async def delete_user(db: AsyncSession, user_id: int) -> bool:
     """Delete a user"""
@@ -63,26 +98,24 @@ async def delete_user(db: AsyncSession, user_id: int) -> bool:
     
     await db.delete(user)
     await db.flush()
+    _user_exists_cache.pop(user_id)
     return True
 
+async def _update_user_flags(db: AsyncSession, user_id: int, **values: bool) -> Optional[UserModel]:
+    """Set WhatsApp flags in one UPDATE ... RETURNING (None if the user doesn't exist)"""
+    result = await db.execute(
+        update(UserModel)
+        .where(UserModel.id == user_id)
+        .values(**values)
+        .returning(UserModel)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
 async def verify_whatsapp(db: AsyncSession, user_id: int) -> Optional[UserModel]:
     """Mark user's WhatsApp as verified"""
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        return None
-    
-    user.whatsapp_verified = True
-    await db.flush()
-    await db.refresh(user)
-    return user
+    return await _update_user_flags(db, user_id, whatsapp_verified=True)
 
 async def toggle_whatsapp_opt_in(db: AsyncSession, user_id: int, opt_in: bool) -> Optional[UserModel]:
     """Toggle user's WhatsApp opt-in status"""
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        return None
-    
-    user.whatsapp_opt_in = opt_in
-    await db.flush()
-    await db.refresh(user)
-    return user
+    return await _update_user_flags(db, user_id, whatsapp_opt_in=opt_in)
@@ -11,179 +11,249 @@ To run this example:
 4. Run: python example_recurring_tasks.py
 """
 
-import requests
-from datetime import datetime, timedelta
-from typing import Dict, Any
+import asyncio
+import random
+import time
+import httpx
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Tuple
 
-BASE_URL = "http://localhost:8000"  # Update if different
+BASE_URL = "http://localhost:8000/api"  # Update if different
 
+# Last ETag, body and freshness deadline seen per GET URL: reads inside the
+# server's Cache-Control max-age are answered from memory, later ones are
+# revalidated with If-None-Match and answered by a bodiless 304
+_etag_cache: Dict[str, Tuple[str, Any, float]] = {}
 
-def create_recurring_pattern(pattern_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a new recurring pattern"""
-    response = requests.post(f"{BASE_URL}/recurring-patterns", json=pattern_data)
-    response.raise_for_status()
-    return response.json()
+# Transient statuses worth retrying a read on, and how often
+RETRY_STATUSES = {429, 502, 503, 504}
+MAX_RETRIES = 3
 
 
-def get_recurring_patterns(family_id: int) -> list:
-    """Get all recurring patterns for a family"""
-    response = requests.get(f"{BASE_URL}/recurring-patterns", params={"family_id": family_id})
+def make_client() -> httpx.AsyncClient:
+    """
+    One keep-alive client for all calls, so requests reuse open sockets and
+    independent ones can run concurrently. The transport retries failed
+    connects (e.g. a server that's still starting up).
+    """
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+        transport=httpx.AsyncHTTPTransport(retries=2)
+    )
+
+
+def retry_delay(attempt: int, response: httpx.Response) -> float:
+    """Seconds to wait before retry #attempt: the server's Retry-After, else exponential backoff with jitter"""
+    retry_after = response.headers.get("retry-after", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    return 0.25 * 2 ** attempt + random.uniform(0, 0.1)
+
+
+def fresh_until(response: httpx.Response) -> float:
+    """Monotonic deadline until which the response may be reused without asking (its max-age)"""
+    for directive in response.headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "max-age" and value.isdigit():
+            return time.monotonic() + int(value)
+    return 0.0
+
+
+async def get_json(client: httpx.AsyncClient, url: str, params: Dict[str, Any]) -> Any:
+    """
+    GET a JSON resource, reusing the cached body while it's fresh or when the
+    server says 304 Not Modified.
+    
+    Reads are idempotent, so transient 429/5xx answers are retried with
+    backoff. Writes are not retried: a 502 can arrive after the server has
+    already committed them.
+    """
+    key = str(client.build_request("GET", url, params=params).url)
+    cached = _etag_cache.get(key)
+    if cached and time.monotonic() < cached[2]:
+        return cached[1]
+    headers = {"If-None-Match": cached[0]} if cached else {}
+    
+    for attempt in range(MAX_RETRIES + 1):
+        response = await client.get(url, params=params, headers=headers)
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            break
+        await asyncio.sleep(retry_delay(attempt, response))
+    
+    if response.status_code == 304 and cached:
+        _etag_cache[key] = (cached[0], cached[1], fresh_until(response))
+        return cached[1]
     response.raise_for_status()
-    return response.json()
+    
+    body = response.json()
+    if "etag" in response.headers:
+        _etag_cache[key] = (response.headers["etag"], body, fresh_until(response))
+    return body
 
 
-def generate_tasks(pattern_id: int, days_ahead: int = 30) -> list:
-    """Generate task instances for a pattern"""
-    response = requests.post(
-        f"{BASE_URL}/recurring-patterns/{pattern_id}/generate",
-        params={"days_ahead": days_ahead}
+def expire_cached_reads() -> None:
+    """After a write, revalidate every cached read on next use (ETags are kept)"""
+    for key, (etag, body, _) in _etag_cache.items():
+        _etag_cache[key] = (etag, body, 0.0)
+
+
+async def create_recurring_patterns(
+    client: httpx.AsyncClient,
+    patterns: List[Dict[str, Any]],
+    generate_days_ahead: int = 30
+) -> List[Dict[str, Any]]:
+    """Create several recurring patterns in one request (all or nothing), with their first tasks"""
+    response = await client.post(
+        "/recurring-patterns/batch",
+        params={"generate_days_ahead": generate_days_ahead},
+        json={"patterns": patterns}
     )
     response.raise_for_status()
+    expire_cached_reads()
     return response.json()
 
 
-def get_pattern_tasks(pattern_id: int, include_completed: bool = False) -> list:
+async def get_recurring_patterns(client: httpx.AsyncClient, family_id: int) -> list:
+    """Get all recurring patterns for a family"""
+    return await get_json(client, "/recurring-patterns", {"family_id": family_id})
+
+
+async def get_pattern_tasks(client: httpx.AsyncClient, pattern_id: int, include_completed: bool = False) -> list:
     """Get all tasks for a recurring pattern"""
-    response = requests.get(
-        f"{BASE_URL}/recurring-patterns/{pattern_id}/tasks",
-        params={"include_completed": include_completed}
+    return await get_json(
+        client,
+        f"/recurring-patterns/{pattern_id}/tasks",
+        {"include_completed": str(include_completed).lower()}
     )
-    response.raise_for_status()
-    return response.json()
 
 
-def main():
-    # Example 1: Weekly class on Sundays at 4 PM
-    print("=" * 60)
-    print("Example 1: Creating weekly Sunday class at 4 PM")
-    print("=" * 60)
+async def main():
+    async with make_client() as client:
+        await run_examples(client)
+
+
+async def run_examples(client: httpx.AsyncClient):
+    # Fields all three example patterns share (the server stores UTC dates)
+    pattern_defaults = {
+        "family_id": 1,  # Update with your family_id
+        "interval": 1,
+        "start_date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "end_date": None,
+        "created_by_user_id": 1,  # Update with your user_id
+        "is_active": True,
+    }
     
+    # Example 1: Weekly class on Sundays at 4 PM
     weekly_class = {
-        "family_id": 1,  # Update with your family_id
+        **pattern_defaults,
         "title": "Take Sarah to Ballet Class",
         "description": "Drive Sarah to ballet at the community center",
         "frequency": "weekly",
-        "interval": 1,
         "by_day": [6],  # Sunday (0=Monday, 6=Sunday)
         "start_time_hour": 16,
         "start_time_minute": 0,
         "duration_minutes": 60,
-        "start_date": datetime.now().isoformat(),
-        "end_date": None,
         "default_assignee_user_id": 2,  # Update with your user_id
-        "created_by_user_id": 1,  # Update with your user_id
-        "is_active": True,
         "meta": {
             "location": "Community Center",
             "notes": "Bring water bottle and ballet shoes"
         }
     }
     
-    try:
-        pattern = create_recurring_pattern(weekly_class)
-        print(f"✓ Created pattern #{pattern['id']}: {pattern['title']}")
-        print(f"  Frequency: {pattern['frequency']}")
-        print(f"  Days: {pattern['by_day']}")
-        print(f"  Time: {pattern['start_time_hour']:02d}:{pattern['start_time_minute']:02d}")
-        print()
-    except Exception as e:
-        print(f"✗ Error creating pattern: {e}")
-        return
-    
     # Example 2: Tuesday and Thursday school pickup
-    print("=" * 60)
-    print("Example 2: Creating Tuesday/Thursday school pickup at 3:30 PM")
-    print("=" * 60)
-    
     school_pickup = {
-        "family_id": 1,
+        **pattern_defaults,
         "title": "School Pickup",
         "description": "Pick up kids from elementary school",
         "frequency": "weekly",
-        "interval": 1,
         "by_day": [1, 3],  # Tuesday=1, Thursday=3
         "start_time_hour": 15,
         "start_time_minute": 30,
         "duration_minutes": 30,
-        "start_date": datetime.now().isoformat(),
-        "end_date": None,
         "default_assignee_user_id": 2,
-        "created_by_user_id": 1,
-        "is_active": True,
         "meta": {
             "location": "Pine Elementary School",
             "notes": "Early dismissal days"
         }
     }
     
-    try:
-        pattern2 = create_recurring_pattern(school_pickup)
-        print(f"✓ Created pattern #{pattern2['id']}: {pattern2['title']}")
-        print(f"  Frequency: {pattern2['frequency']}")
-        print(f"  Days: {pattern2['by_day']}")
-        print(f"  Time: {pattern2['start_time_hour']:02d}:{pattern2['start_time_minute']:02d}")
-        print()
-    except Exception as e:
-        print(f"✗ Error creating pattern: {e}")
-        return
-    
     # Example 3: Daily morning routine
-    print("=" * 60)
-    print("Example 3: Creating daily morning medication reminder")
-    print("=" * 60)
-    
     daily_task = {
-        "family_id": 1,
+        **pattern_defaults,
         "title": "Morning Medication",
         "description": "Take vitamins and supplements",
         "frequency": "daily",
-        "interval": 1,
         "by_day": None,
         "start_time_hour": 8,
         "start_time_minute": 0,
         "duration_minutes": 5,
-        "start_date": datetime.now().isoformat(),
-        "end_date": None,
         "default_assignee_user_id": 1,
-        "created_by_user_id": 1,
-        "is_active": True,
         "meta": {
             "reminder_type": "medication",
             "notes": "With breakfast"
         }
     }
     
+    examples = [
+        ("Example 1: Creating weekly Sunday class at 4 PM", weekly_class),
+        ("Example 2: Creating Tuesday/Thursday school pickup at 3:30 PM", school_pickup),
+        ("Example 3: Creating daily morning medication reminder", daily_task),
+    ]
+    
+    # One batch request creates all three (in a single INSERT on the server)
+    # along with their next 60 days of tasks
     try:
-        pattern3 = create_recurring_pattern(daily_task)
-        print(f"✓ Created pattern #{pattern3['id']}: {pattern3['title']}")
-        print(f"  Frequency: {pattern3['frequency']}")
-        print(f"  Time: {pattern3['start_time_hour']:02d}:{pattern3['start_time_minute']:02d}")
-        print()
+        created = await create_recurring_patterns(
+            client, [data for _, data in examples], generate_days_ahead=60
+        )
     except Exception as e:
-        print(f"✗ Error creating pattern: {e}")
+        print(f"✗ Error creating patterns: {e}")
         return
     
+    for (heading, _), result in zip(examples, created):
+        print("=" * 60)
+        print(heading)
+        print("=" * 60)
+        
+        print(f"✓ Created pattern #{result['id']}: {result['title']}")
+        print(f"  Frequency: {result['frequency']}")
+        if result['by_day']:
+            print(f"  Days: {result['by_day']}")
+        print(f"  Time: {result['start_time_hour']:02d}:{result['start_time_minute']:02d}")
+        print()
+    
+    pattern = created[0]
+    
+    # Both reads are independent
+    patterns, tasks = await asyncio.gather(
+        get_recurring_patterns(client, family_id=1),
+        get_pattern_tasks(client, pattern['id']),
+        return_exceptions=True
+    )
+    
     # Get all patterns for the family
     print("=" * 60)
     print("Retrieving all patterns for family")
     print("=" * 60)
     
-    try:
-        patterns = get_recurring_patterns(family_id=1)
+    if isinstance(patterns, Exception):
+        print(f"✗ Error getting patterns: {patterns}")
+    else:
         print(f"✓ Found {len(patterns)} recurring patterns:")
         for p in patterns:
             print(f"  - #{p['id']}: {p['title']} ({p['frequency']})")
         print()
-    except Exception as e:
-        print(f"✗ Error getting patterns: {e}")
     
     # Get tasks for the first pattern
     print("=" * 60)
     print(f"Getting tasks for pattern #{pattern['id']}")
     print("=" * 60)
     
-    try:
-        tasks = get_pattern_tasks(pattern['id'])
+    if isinstance(tasks, Exception):
+        print(f"✗ Error getting tasks: {tasks}")
+    else:
         print(f"✓ Found {len(tasks)} task instances:")
         for task in tasks[:5]:  # Show first 5
             print(f"  - Task #{task['id']}: {task['occurrence_date']} at "
@@ -192,32 +262,18 @@ def main():
         if len(tasks) > 5:
             print(f"  ... and {len(tasks) - 5} more")
         print()
-    except Exception as e:
-        print(f"✗ Error getting tasks: {e}")
-    
-    # Generate more tasks (60 days ahead)
-    print("=" * 60)
-    print(f"Generating more tasks for pattern #{pattern['id']}")
-    print("=" * 60)
-    
-    try:
-        new_tasks = generate_tasks(pattern['id'], days_ahead=60)
-        print(f"✓ Generated {len(new_tasks)} new task instances")
-        print()
-    except Exception as e:
-        print(f"✗ Error generating tasks: {e}")
     
     print("=" * 60)
     print("Example completed successfully!")
     print("=" * 60)
     print("\nNext steps:")
-    print("1. View tasks at: GET /tasks?family_id=1")
-    print("2. Complete a task: POST /tasks/{task_id}/complete")
-    print("3. Update a pattern: PUT /recurring-patterns/{pattern_id}")
-    print("4. Deactivate a pattern: PATCH /recurring-patterns/{pattern_id}/deactivate")
+    print("1. View tasks at: GET /api/tasks?family_id=1")
+    print("2. Complete a task: POST /api/tasks/{task_id}/complete")
+    print("3. Update a pattern: PUT /api/recurring-patterns/{pattern_id}")
+    print("4. Deactivate a pattern: PATCH /api/recurring-patterns/{pattern_id}/deactivate")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
 
 